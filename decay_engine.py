@@ -4,7 +4,7 @@ decay_engine.py - Core decay functionality and state management
 import time
 import pygame
 import numpy as np
-from utils.color_utils import get_decay_palette, apply_decay_to_color
+from utils.color_utils import get_decay_palette, apply_decay_to_color, apply_decay_to_colors
 from utils.color_utils import load_jetbrains_mono_font
 
 class DecayEngine:
@@ -21,6 +21,7 @@ class DecayEngine:
         self.decay_time = decay_time
         self.last_update = time.time()
         self.reached_zero = False  # Flag to track if we've hit zero
+        self.on_zero = None  # Optional callback, called when decay reaches zero
     
     def update(self, delta_time=None):
         """
@@ -50,6 +51,8 @@ class DecayEngine:
             if not self.reached_zero:
                 self.reached_zero = True
                 print("CRITICAL: DECAY HAS REACHED EXACT 0%")
+                if self.on_zero:
+                    self.on_zero()
             
             # Ensure it stays exactly at 0.0 for reliable detection
             self.decay_percentage = 0.0
@@ -79,6 +82,8 @@ class DecayEngine:
             if not self.reached_zero:
                 self.reached_zero = True
                 print("CRITICAL: DECAY HAS REACHED EXACT 0% THROUGH MODIFICATION")
+                if self.on_zero:
+                    self.on_zero()
             
             # Set to exactly 0.0 for reliable detection
             self.decay_percentage = 0.0
@@ -120,5 +125,19 @@ class DecayEngine:
         
         # Apply decay to color
         return apply_decay_to_color(base_color, 1.0 - decay_factor)
-
-
+    
+    def get_decay_colors(self, base_colors):
+        """
+        Transform many colors at once based on current decay level
+        
+        Args:
+            base_colors (np.ndarray): Array of shape (n, 3) with RGB colors
+        
+        Returns:
+            np.ndarray: Array of shape (n, 3) with transformed uint8 RGB colors
+        """
+        # Calculate decay factor (1.0 = no decay, 0.0 = full decay)
+        decay_factor = self.decay_percentage / 100.0
+        
+        # Apply decay to all colors in one pass
+        return apply_decay_to_colors(base_colors, 1.0 - decay_factor)
@@ -2,23 +2,61 @@
 game2.py - Bounce game with decay grid color scheme (Modified)
 """
 import pygame
-import random
 import math
+import numpy as np
 import json
 import os
 import sys
+import gc
+import time
 from utils.decay_bar import DecayBar
 from utils.color_utils import load_jetbrains_mono_font
 from utils.asset_utils import get_asset_path
+from utils import block_kernels
 
 
 json_path = get_asset_path('decay_grids.json')
 with open(json_path, 'r') as f:
     DECAY_GRIDS = json.load(f)
 
+# Falling blocks are stored as parallel arrays on Game2, one entry per block
+BLOCK_FIELDS = ('xs', 'ys', 'ws', 'hs', 'vys', 'decay_levels', 'grid_rows', 'grid_cols')
+INITIAL_BLOCK_CAPACITY = 256
+
+# Number of blocks' worth of random spawn parameters drawn at a time
+SPAWN_BATCH = 256
+
+# Block colors are quantized to 32 levels per channel so tiles can be shared
+TILE_COLOR_SHIFT = 3
+MAX_CACHED_TILES = 2048
+BLOCK_BORDER_COLOR = (200, 200, 200)
+
+# Seconds between manual garbage collections while the game loop runs
+GC_INTERVAL = 5.0
+
+# Event types Game2.update responds to
+HANDLED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN)
+
+# RGB colors of the decay grid, indexed as DECAY_RGB[stage][row][col]
+DECAY_RGB = [
+    [
+        [(int(hex_color[1:3], 16), int(hex_color[3:5], 16), int(hex_color[5:7], 16)) for hex_color in row]
+        for row in stage["grid"]
+    ]
+    for stage in DECAY_GRIDS["stages"]
+]
+
+# The same table as a (stage, row, col, 3) array, for gathering many colors at once
+DECAY_RGB_NP = np.array(DECAY_RGB, dtype=np.uint8)
+
+# Rect reused for every paddle draw; pygame.draw.rect only reads it
+_SHARED_RECT = pygame.Rect(0, 0, 0, 0)
+
 class Paddle:
     """Represents the player-controlled paddle"""
     
+    __slots__ = ('x', 'y', 'width', 'height', 'speed', 'moved', '_cached_stage', '_cached_color')
+    
     def __init__(self, screen_width, screen_height):
         """
         Initialize the paddle
@@ -34,6 +72,13 @@ class Paddle:
         self.y = screen_height - self.height - 60
         self.speed = 800  # Pixels per second
         
+        # Color of the last decay stage drawn, reused until the stage changes
+        self._cached_stage = -1
+        self._cached_color = None
+        
+        # Whether the last update changed the paddle's position
+        self.moved = False
+        
     def update(self, delta_time, keys, screen_width):
         """
         Update the paddle position based on keyboard input
@@ -43,6 +88,7 @@ class Paddle:
             keys (pygame.key.ScancodeWrapper): Current keyboard state
             screen_width (int): Width of the screen
         """
+        old_x = self.x
         if keys[pygame.K_LEFT]:
             self.x -= self.speed * delta_time
         if keys[pygame.K_RIGHT]:
@@ -50,6 +96,7 @@ class Paddle:
         
         # Keep paddle within screen bounds
         self.x = max(0, min(screen_width - self.width, self.x))
+        self.moved = self.x != old_x
     
     def draw(self, surface, decay_engine):
         """
@@ -64,7 +111,11 @@ class Paddle:
         middle_col = 6  # Middle of 13 columns
         color = self._get_decay_color(middle_row, middle_col, decay_engine)
         
-        rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        rect = _SHARED_RECT
+        rect.x = self.x
+        rect.y = self.y
+        rect.w = self.width
+        rect.h = self.height
         pygame.draw.rect(surface, color, rect)
         pygame.draw.rect(surface, (200, 200, 200), rect, 2)  # Border
     
@@ -72,6 +123,8 @@ class Paddle:
         """Get color from decay grid based on global decay"""
         decay_value = 1.0 - (decay_engine.decay_percentage / 100.0)
         stage_index = min(5, int(decay_value * 6))
+        if stage_index == self._cached_stage:
+            return self._cached_color
         
         # Get color from decay grid
         hex_color = DECAY_GRIDS["stages"][stage_index]["grid"][row][col]
@@ -81,138 +134,9 @@ class Paddle:
         g = int(hex_color[3:5], 16)
         b = int(hex_color[5:7], 16)
         
-        return (r, g, b)
-
-class Block:
-    """Represents a falling block"""
-    
-    def __init__(self, x, y, width, height, decay_level):
-        """
-        Initialize a falling block
-        
-        Args:
-            x (float): X position
-            y (float): Y position
-            width (int): Block width
-            height (int): Block height
-            decay_level (float): Initial decay level (0.0 to 1.0)
-        """
-        self.x = x
-        self.y = y
-        self.width = width
-        self.height = height
-        self.velocity_y = random.uniform(100, 250)  # Falling speed
-        # No horizontal velocity - blocks only move vertically
-        self.velocity_x = 0
-        self.decay_level = decay_level
-        
-        # No hit counter since we don't show scores
-        
-        # Assign random position in decay grid for consistent colors
-        self.grid_row = random.randint(0, 6)
-        self.grid_col = random.randint(0, 12)
-        
-    def update(self, delta_time, screen_width):
-        """
-        Update the block position
-        
-        Args:
-            delta_time (float): Time in seconds since last update
-            screen_width (int): Width of the screen
-        
-        Returns:
-            bool: True if block is still on screen, False if it has fallen off
-        """
-        self.y += self.velocity_y * delta_time
-        
-        # Bounce off top of screen
-        if self.y < 0:
-            self.velocity_y *= -0.9  # Reverse and dampen
-            self.y = 0
-        
-        # Check if fallen off bottom of screen
-        return self.y < screen_width
-    
-    def check_collision(self, paddle):
-        """
-        Check for collision with paddle
-        
-        Args:
-            paddle (Paddle): The player's paddle
-            
-        Returns:
-            bool: True if collision detected, False otherwise
-        """
-        # Check if any part of the block overlaps with the paddle
-        return (self.x < paddle.x + paddle.width and
-                self.x + self.width > paddle.x and
-                self.y < paddle.y + paddle.height and
-                self.y + self.height > paddle.y)
-    
-    def handle_collision(self):
-        """
-        Handle collision with paddle - only vertical bounce, no horizontal movement
-        
-        Returns:
-            float: Amount to modify the global decay percentage
-        """
-        # Stronger upward bounce, with no horizontal movement
-        self.velocity_y *= -1.2
-        
-        # No hit counter increment since we're not showing scores
-        
-        # Reduce decay level with each hit (block becomes "healthier")
-        old_decay = self.decay_level
-        self.decay_level = max(0.0, self.decay_level - 0.2)
-        
-        # Return the amount of decay reduction for the global decay system
-        return (old_decay - self.decay_level) * 2.0
-    
-    def get_color(self, decay_engine):
-        """
-        Get the block's color based on its decay level using decay grid
-        
-        Args:
-            decay_engine (DecayEngine): Reference to the decay engine
-            
-        Returns:
-            tuple: RGB color tuple
-        """
-        # Get color based on block's individual decay level
-        stage_index = min(5, int(self.decay_level * 6))
-        
-        # Get color from assigned grid position
-        hex_color = DECAY_GRIDS["stages"][stage_index]["grid"][self.grid_row][self.grid_col]
-        
-        # Convert hex to RGB
-        r = int(hex_color[1:3], 16)
-        g = int(hex_color[3:5], 16)
-        b = int(hex_color[5:7], 16)
-        
-        # Apply global decay effect
-        color = decay_engine.get_decay_color((r, g, b))
-        
-        # Ensure color values are integers and within valid range
-        return (
-            max(0, min(255, int(color[0]))),
-            max(0, min(255, int(color[1]))),
-            max(0, min(255, int(color[2])))
-        )
-    
-    def draw(self, surface, decay_engine):
-        """
-        Draw the block - no score display
-        
-        Args:
-            surface (pygame.Surface): Surface to draw on
-            decay_engine (DecayEngine): Reference to the decay engine
-        """
-        color = self.get_color(decay_engine)
-        rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        pygame.draw.rect(surface, color, rect)
-        pygame.draw.rect(surface, (200, 200, 200), rect, 2)  # Border
-        
-        # No hit count display
+        self._cached_stage = stage_index
+        self._cached_color = (r, g, b)
+        return self._cached_color
 
 # No custom decay bar
 
@@ -230,6 +154,9 @@ class Game2:
         pygame.display.set_caption("Bounce Game")
         self.clock = pygame.time.Clock()
         
+        # Mouse motion is never used, so don't queue it at all
+        pygame.event.set_blocked(pygame.MOUSEMOTION)
+        
         # Show loading screen
         loading_font = load_jetbrains_mono_font(24)
         loading_text = loading_font.render("Initializing Game Assets...", True, (173, 180, 125))
@@ -243,22 +170,52 @@ class Game2:
         # Create paddle
         self.paddle = Paddle(screen_width, screen_height)
         
-        # Create initial blocks
-        self.blocks = []
+        # Create initial blocks - one slot per block in each array, the first
+        # n_blocks slots are live
+        self.n_blocks = 0
+        self._allocate_blocks(INITIAL_BLOCK_CAPACITY)
         self.spawn_timer = 0
         self.spawn_interval = 2.0  # Time between block spawns in seconds
         
+        # Random spawn parameters are drawn in batches and consumed in order
+        self._rng = np.random.default_rng()
+        self._refill_spawn_buffers()
+        
         # Create decay bar - full width at bottom
         self.decay_bar = DecayBar(pygame.Rect(0, screen_height - 40, screen_width, 30), decay_engine, full_width=True)
         
         # Font for text
         self.font = load_jetbrains_mono_font(24)
         
-        # For calculating delta time
-        self.last_time = pygame.time.get_ticks()
-        
-        # Back button
+        # Back button - layout never changes, so render it once
         self.back_button = None
+        self._back_button_rect = pygame.Rect(self.screen_width - 100, 20, 80, 30)
+        self._back_text = self.font.render("Back", True, (255, 255, 255))
+        self._back_text_rect = self._back_text.get_rect(center=self._back_button_rect.center)
+        
+        # Instructions text, also rendered once
+        self._instr_surf = self.font.render("Use LEFT/RIGHT arrow keys to move paddle", True, (255, 255, 255))
+        self._instr_pos = (self.screen_width // 2 - self._instr_surf.get_width() // 2, 60)
+        
+        # Pre-rendered block tiles keyed by (w, h, r, g, b), and their
+        # outlines keyed by (w, h), blitted in one batched call per frame
+        self._tile_cache = {}
+        self._outline_cache = {}
+        self._tile_items = []
+        self._outline_items = []
+        
+        # Block colors from the last frame, recomputed only when a block is
+        # added, removed or hit, or the global decay moves to a new percent
+        self._block_colors = []
+        self._block_colors_dirty = True
+        self._block_color_bucket = -1
+        
+        # Frames are only redrawn when something visible has changed
+        self.blocks_changed = True
+        self._drawn_decay_width = -1
+        
+        # Compile the block physics now rather than on the first frame
+        block_kernels.warm_up(screen_height)
         
         # Pre-spawn a few blocks for immediate gameplay
         for _ in range(3):
@@ -271,18 +228,68 @@ class Game2:
         self.screen.blit(ready_text, ready_rect)
         pygame.display.flip()
         pygame.time.delay(300)  # Brief pause
+        
+        # Start frame timing after loading so the first frame's delta is small
+        self.clock.tick()
+    
+    def _allocate_blocks(self, capacity):
+        """
+        Allocate (or grow) the block arrays, preserving live blocks
+        
+        Args:
+            capacity (int): Number of block slots to allocate
+        """
+        n = self.n_blocks
+        for name, dtype in zip(BLOCK_FIELDS, (np.float64,) * 6 + (np.int32,) * 2):
+            arr = np.zeros(capacity, dtype=dtype)
+            if n:
+                arr[:n] = getattr(self, name)[:n]
+            setattr(self, name, arr)
+        self.block_capacity = capacity
+    
+    def _refill_spawn_buffers(self):
+        """Draw the random parameters for the next SPAWN_BATCH blocks"""
+        rng = self._rng
+        self._spawn_widths = rng.integers(30, 81, size=SPAWN_BATCH).tolist()
+        self._spawn_heights = rng.integers(20, 41, size=SPAWN_BATCH).tolist()
+        self._spawn_x_fractions = rng.random(SPAWN_BATCH).tolist()
+        self._spawn_decay_scales = rng.uniform(0.5, 1.0, size=SPAWN_BATCH).tolist()
+        self._spawn_speeds = rng.uniform(100, 250, size=SPAWN_BATCH).tolist()
+        self._spawn_rows = rng.integers(0, 7, size=SPAWN_BATCH).tolist()
+        self._spawn_cols = rng.integers(0, 13, size=SPAWN_BATCH).tolist()
+        self._spawn_index = 0
     
     def spawn_block(self):
         """Spawn a new block at the top of the screen"""
-        width = random.randint(30, 80)
-        height = random.randint(20, 40)
-        x = random.randint(0, self.screen_width - width)
+        if self._spawn_index == SPAWN_BATCH:
+            self._refill_spawn_buffers()
+        r = self._spawn_index
+        self._spawn_index = r + 1
+        
+        width = self._spawn_widths[r]
+        height = self._spawn_heights[r]
+        x = int(self._spawn_x_fractions[r] * (self.screen_width - width + 1))
         
         # Initial decay level is related to global decay
         global_decay = 1.0 - (self.decay_engine.decay_percentage / 100.0)
-        decay_level = global_decay * random.uniform(0.5, 1.0)
-        
-        self.blocks.append(Block(x, 0, width, height, decay_level))
+        decay_level = global_decay * self._spawn_decay_scales[r]
+        
+        if self.n_blocks == self.block_capacity:
+            self._allocate_blocks(self.block_capacity * 2)
+        
+        i = self.n_blocks
+        self.xs[i] = x
+        self.ys[i] = 0
+        self.ws[i] = width
+        self.hs[i] = height
+        self.vys[i] = self._spawn_speeds[r]  # Falling speed, no horizontal movement
+        self.decay_levels[i] = decay_level
+        # Assign random position in decay grid for consistent colors
+        self.grid_rows[i] = self._spawn_rows[r]
+        self.grid_cols[i] = self._spawn_cols[r]
+        self.n_blocks = i + 1
+        self._block_colors_dirty = True
+        self.blocks_changed = True
     
     def update_blocks(self, delta_time):
         """
@@ -294,29 +301,34 @@ class Game2:
         Returns:
             float: Total decay change from all collisions
         """
-        total_decay_change = 0.0
         keys = pygame.key.get_pressed()
         
         # Update paddle
         self.paddle.update(delta_time, keys, self.screen_width)
         
-        # Update blocks and check for collisions
-        blocks_to_remove = []
-        for block in self.blocks:
-            # Update block position
-            if not block.update(delta_time, self.screen_width):
-                blocks_to_remove.append(block)
-                continue
-            
-            # Check for collision with paddle
-            if block.check_collision(self.paddle):
-                decay_change = block.handle_collision()
-                total_decay_change += decay_change
-        
-        # Remove blocks that have fallen off screen
-        for block in blocks_to_remove:
-            if block in self.blocks:
-                self.blocks.remove(block)
+        # Read paddle bounds once rather than per block
+        paddle = self.paddle
+        px = paddle.x
+        py = paddle.y
+        pw = paddle.width
+        ph = paddle.height
+        sh = self.screen_height
+        
+        # Move, bounce, cull and collide all blocks in one pass
+        n_before = self.n_blocks
+        self.n_blocks, total_decay_change = block_kernels.step_blocks(
+            self.xs, self.ys, self.ws, self.hs, self.vys, self.decay_levels,
+            self.grid_rows, self.grid_cols, self.n_blocks,
+            float(delta_time), float(sh), float(px), float(py), float(pw), float(ph)
+        )
+        if self.n_blocks != n_before or total_decay_change:
+            self._block_colors_dirty = True
+            self.blocks_changed = True
+        elif self.n_blocks:
+            # Moving less than half a pixel doesn't change what's drawn
+            self.blocks_changed = float(np.abs(self.vys[:self.n_blocks]).max()) * delta_time >= 0.5
+        else:
+            self.blocks_changed = False
         
         # Spawn new blocks
         self.spawn_timer += delta_time
@@ -328,7 +340,7 @@ class Game2:
     
     def draw_back_button(self, surface):
         """Draw the back button with green outline, black middle and green text"""
-        button_rect = pygame.Rect(self.screen_width - 100, 20, 80, 30)
+        button_rect = self._back_button_rect
         
         # Black background
         pygame.draw.rect(surface, (0, 0, 0), button_rect)
@@ -337,19 +349,17 @@ class Game2:
         pygame.draw.rect(surface, (255, 255, 255), button_rect, 2)
         
         # Green text
-        text = self.font.render("Back", True, (255, 255, 255))
-        text_rect = text.get_rect(center=button_rect.center)
-        surface.blit(text, text_rect)
+        surface.blit(self._back_text, self._back_text_rect)
         
         return button_rect
     
-    def update(self):
-        """Update game state and handle events"""
-        # Calculate delta time
-        current_time = pygame.time.get_ticks()
-        delta_time = (current_time - self.last_time) / 1000.0  # Convert to seconds
-        self.last_time = current_time
+    def update(self, delta_time):
+        """
+        Update game state and handle events
         
+        Args:
+            delta_time (float): Time in seconds since last update
+        """
         # Update decay naturally over time
         self.decay_engine.update(delta_time)
         
@@ -357,8 +367,8 @@ class Game2:
         decay_change = self.update_blocks(delta_time)
         self.decay_engine.modify_decay(decay_change * 10)  # Convert to percentage points
         
-        # Handle events
-        for event in pygame.event.get():
+        # Handle events - only fetch the types handled here, drop the rest
+        for event in pygame.event.get(HANDLED_EVENTS):
             if event.type == pygame.QUIT:
                 return False
             elif event.type == pygame.KEYDOWN:
@@ -370,17 +380,126 @@ class Game2:
                     if self.back_button and self.back_button.collidepoint(event.pos):
                         print("Back button clicked in Game2")
                         return "main_menu"
+        pygame.event.clear()
         
         return True
     
+    def _get_block_colors(self):
+        """
+        Get the color of every live block, reusing last frame's colors when
+        nothing affecting them has changed
+        
+        Returns:
+            list: Quantized RGB color per block
+        """
+        bucket = int(self.decay_engine.decay_percentage)
+        if not self._block_colors_dirty and bucket == self._block_color_bucket:
+            return self._block_colors
+        
+        n = self.n_blocks
+        
+        # Get color based on each block's individual decay level and grid position
+        stages = np.clip((self.decay_levels[:n] * 6).astype(np.int32), 0, 5)
+        base_colors = DECAY_RGB_NP[stages, self.grid_rows[:n], self.grid_cols[:n]]
+        
+        # Apply global decay effect, clamped to valid uint8 channels,
+        # then quantize so blocks of similar color share a tile
+        colors = self.decay_engine.get_decay_colors(base_colors)
+        self._block_colors = ((colors >> TILE_COLOR_SHIFT) << TILE_COLOR_SHIFT).tolist()
+        self._block_colors_dirty = False
+        self._block_color_bucket = bucket
+        return self._block_colors
+    
+    def _get_block_tile(self, w, h, color):
+        """
+        Get a pre-rendered block tile, creating it on first use
+        
+        Args:
+            w, h (int): Size of the block
+            color (list): Quantized RGB color of the block
+            
+        Returns:
+            pygame.Surface: Block tile
+        """
+        key = (w, h, color[0], color[1], color[2])
+        tile = self._tile_cache.get(key)
+        if tile is None:
+            tile = pygame.Surface((w, h)).convert()
+            tile.fill(color)
+            self._tile_cache[key] = tile
+        return tile
+    
+    def _get_block_outline(self, w, h):
+        """
+        Get a pre-rendered block border, transparent inside
+        
+        Args:
+            w, h (int): Size of the block
+            
+        Returns:
+            pygame.Surface: Border surface
+        """
+        outline = self._outline_cache.get((w, h))
+        if outline is None:
+            outline = pygame.Surface((w, h)).convert()
+            outline.fill((0, 0, 0))
+            outline.set_colorkey((0, 0, 0))
+            pygame.draw.rect(outline, BLOCK_BORDER_COLOR, outline.get_rect(), 2)
+            self._outline_cache[(w, h)] = outline
+        return outline
+    
+    def _blit_batch(self, items):
+        """
+        Blit a sequence of (surface, position) pairs in a single call
+        
+        Args:
+            items (list): (surface, position) pairs
+        """
+        # fblits skips the per-item return value, but only newer pygame builds have it
+        if hasattr(self.screen, 'fblits'):
+            self.screen.fblits(items)
+        else:
+            self.screen.blits(items, doreturn=False)
+    
+    def needs_redraw(self):
+        """
+        Check whether anything visible has changed since the last draw
+        
+        Returns:
+            bool: True if the frame should be redrawn
+        """
+        # The decay bar fill (and with it the decay stage) moves a pixel at a time
+        decay_width = int(self.screen_width * self.decay_engine.decay_percentage / 100.0)
+        if decay_width != self._drawn_decay_width:
+            self._drawn_decay_width = decay_width
+            return True
+        return self.paddle.moved or self.blocks_changed
+    
     def draw(self):
         """Draw all game elements"""
         # Fill background with black
         self.screen.fill((0, 0, 0))
         
-        # Draw all blocks
-        for block in self.blocks:
-            block.draw(self.screen, self.decay_engine)
+        # Compute every block's color in one vectorized pass
+        n = self.n_blocks
+        if n:
+            colors = self._get_block_colors()
+            
+            # Draw all blocks, then all borders, in one batched blit each
+            positions = list(zip(self.xs[:n].tolist(), self.ys[:n].tolist()))
+            sizes = list(zip(self.ws[:n].astype(np.int32).tolist(), self.hs[:n].astype(np.int32).tolist()))
+            if len(self._tile_cache) > MAX_CACHED_TILES:
+                self._tile_cache.clear()
+            
+            tiles = self._tile_items
+            outlines = self._outline_items
+            tiles.clear()
+            outlines.clear()
+            for (w, h), color, pos in zip(sizes, colors, positions):
+                tiles.append((self._get_block_tile(w, h, color), pos))
+                outlines.append((self._get_block_outline(w, h), pos))
+            self._blit_batch(tiles)
+            self._blit_batch(outlines)
         
         # Draw paddle
         self.paddle.draw(self.screen, self.decay_engine)
@@ -390,16 +509,37 @@ class Game2:
         self.back_button = self.draw_back_button(self.screen)
         
         # Draw instructions
-        instructions = "Use LEFT/RIGHT arrow keys to move paddle"
-        text = self.font.render(instructions, True, (255, 255, 255))
-        self.screen.blit(text, (self.screen_width // 2 - text.get_width() // 2, 60))
+        self.screen.blit(self._instr_surf, self._instr_pos)
     
 
     def run(self):
         """Run the game loop"""
+        # Automatic collections cause frame spikes, so collect the youngest
+        # generation on a fixed schedule instead
+        gc.disable()
+        last_gc = time.monotonic()
+        try:
+            return self._run_loop(last_gc)
+        finally:
+            gc.enable()
+    
+    def _run_loop(self, last_gc):
+        """
+        Run the game loop with automatic garbage collection disabled
+        
+        Args:
+            last_gc (float): time.monotonic() of the last collection
+        """
         running = True
         while running:
-            result = self.update()
+            # Milliseconds since the last frame, capped at 60 FPS
+            delta_time = self.clock.tick(60) / 1000.0
+            result = self.update(delta_time)
+            
+            now = time.monotonic()
+            if now - last_gc >= GC_INTERVAL:
+                gc.collect(0)
+                last_gc = now
             
             # *** CRITICAL ADDITION: Check for 0% decay ***
             # This ensures each game can trigger the end screen
@@ -413,8 +553,9 @@ class Game2:
             elif isinstance(result, str):
                 return result
             
-            self.draw()
-            pygame.display.flip()
-            self.clock.tick(60)
+            # Skip drawing frames identical to the one on screen
+            if self.needs_redraw():
+                self.draw()
+                pygame.display.flip()
         
         return None
\ No newline at end of file
@@ -2,19 +2,59 @@
 game3.py - Keyboard Simon Says game with DISSOLVE animation frames synced to decay
 """
 import pygame
-import random
 import os
 import sys
-import time
 import re
+import math
 import json
+import numpy as np
+from functools import lru_cache
+from collections import OrderedDict
+from array import array
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from utils.decay_bar import DecayBar
 from utils.color_utils import load_jetbrains_mono_font
 from utils.asset_utils import get_asset_path
 
 
+# Print per-level and per-key debug output (off during normal play)
+DEBUG = False
+
+# Resolution of the decay percentage -> frame lookup table (steps per percent)
+PCT_STEPS = 100
+
+# Rendered loading screen messages, kept across visits to the game
+_LOADING_TEXT_CACHE = {}
+
+# Number of rendered text surfaces Game3 keeps for reuse
+TEXT_CACHE_SIZE = 128
+
+# Number of decoded DISSOLVE frames kept in memory at once
+FRAME_CACHE_SIZE = 64
+
+# Frame number of a DISSOLVE animation frame, e.g. DISSOLVE0001_10042.png -> 10042
+_FRAME_RE = re.compile(r'DISSOLVE\d+_(\d+)')
+
+# Event types Game3.update responds to
+HANDLED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN)
+
+def _hex2rgb(hex_color):
+    """
+    Convert a "#rrggbb" (or "rrggbb") hex string to an RGB tuple
+    
+    Args:
+        hex_color (str): Hex color string
+        
+    Returns:
+        tuple: RGB color tuple
+    """
+    v = int(hex_color[1:], 16) if hex_color[0] == '#' else int(hex_color, 16)
+    return (v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF
+
+@lru_cache(maxsize=1)
 def load_decay_colors():
-    """Load color scheme from decay_grids.json"""
+    """Load color scheme from decay_grids.json (cached after the first call)"""
     try:
         json_path = get_asset_path('decay_grids.json')
         
@@ -27,9 +67,9 @@ def load_decay_colors():
         end_hex = "#799f96"    # Teal from Stage 6
         
         # Convert hex to RGB
-        begin_rgb = tuple(int(begin_hex.lstrip('#')[i:i+2], 16) for i in (0, 2, 4))
-        middle_rgb = tuple(int(middle_hex.lstrip('#')[i:i+2], 16) for i in (0, 2, 4))
-        end_rgb = tuple(int(end_hex.lstrip('#')[i:i+2], 16) for i in (0, 2, 4))
+        begin_rgb = _hex2rgb(begin_hex)
+        middle_rgb = _hex2rgb(middle_hex)
+        end_rgb = _hex2rgb(end_hex)
         
         return begin_rgb, middle_rgb, end_rgb
     except Exception as e:
@@ -40,16 +80,28 @@ def load_decay_colors():
 class BlenderAnimation:
     """Manages a sequence of Blender animation frames from the DISSOLVE sequence"""
     
-    def __init__(self, base_dir=None):
+    def __init__(self, base_dir=None, target_width=None):
         """
         Initialize the animation with DISSOLVE frames
         
         Args:
             base_dir (str): Base directory containing animation frames
+            target_width (float, optional): Width frames are drawn at; frames
+                are scaled to it once, as they are loaded, keeping aspect ratio
         """
-        self.frames = []
+        self.target_width = target_width
+        self.frames = []  # Generated frames, rendered on first use and kept in memory
+        self.num_frames = 0
         self.current_frame = 0
         
+        # DISSOLVE frames are decoded on demand and kept in a bounded LRU cache,
+        # with the next frame decoded ahead on a background thread
+        self._frame_paths = []
+        self._frame_cache = OrderedDict()
+        self._prefetch_index = -1
+        self._prefetch_future = None
+        self._executor = None
+        
         # If no base directory is specified, use the default path
         if base_dir is None:
            base_dir = get_asset_path("blender", "animation")
@@ -65,75 +117,164 @@ class BlenderAnimation:
     
     def load_dissolve_frames(self, rerender_dir):
         """
-        Load DISSOLVE animation frames from the rerender directory
+        Find DISSOLVE animation frames in the rerender directory; frames are
+        decoded later, as get_frame asks for them
         
         Args:
             rerender_dir (str): Path to the directory with DISSOLVE frames
         """
-        # Get all PNG files in the directory
-        files = [f for f in os.listdir(rerender_dir) if f.endswith('.png') and f.startswith('DISSOLVE')]
-        
-        # Define a function to extract the frame number from the filename
-        def get_frame_number(filename):
-            # Extract the number after the underscore
-            match = re.search(r'DISSOLVE\d+_(\d+)', filename)
-            if match:
-                return int(match.group(1))
-            return 0
+        # Collect (frame number, path) for every DISSOLVE PNG in one directory pass
+        files = []
+        with os.scandir(rerender_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith('DISSOLVE') and name.endswith('.png'):
+                    match = _FRAME_RE.search(name)
+                    files.append((int(match.group(1)) if match else 0, entry.path))
         
         # Sort files by frame number
-        files.sort(key=get_frame_number)
+        files.sort(key=itemgetter(0))
         
         print(f"Found {len(files)} DISSOLVE animation frames")
         
-        # Load all frames
-        for i, filename in enumerate(files):
-            file_path = os.path.join(rerender_dir, filename)
-            try:
-                surface = pygame.image.load(file_path)
-                self.frames.append(surface)
-                
-                # Print progress every 100 frames
-                if i % 100 == 0 or i == len(files) - 1:
-                    print(f"Loaded {i+1}/{len(files)} frames...")
-            except Exception as e:
-                print(f"Error loading frame {file_path}: {e}")
+        self._frame_paths = [file_path for _, file_path in files]
+        self.num_frames = len(self._frame_paths)
+        self._build_frame_lookup()
         
-        self.num_frames = len(self.frames)
-        print(f"Successfully loaded {self.num_frames} DISSOLVE animation frames")
+        # One worker is enough to stay ahead of decay, which moves a frame at a time
+        if self.num_frames:
+            self._executor = ThreadPoolExecutor(max_workers=1)
     
     def create_default_frames(self, num_frames):
         """
         Create default animation frames when no image files are available
         
+        Only the frame colors are computed here; each frame is rendered the
+        first time it is shown.
+        
         Args:
             num_frames (int): Number of frames to generate
         """
-        self.frames = []
+        # Calculate color gradient (blue to red) for every frame at once
+        normalized = np.arange(num_frames) / max(1, num_frames - 1)
+        self._default_colors = np.stack([
+            255 * normalized,
+            100 * (0.5 - np.abs(0.5 - normalized)),
+            255 * (1 - normalized)
+        ], axis=1).astype(np.uint8).tolist()
+        self._default_font = None
+        self.frames = [None] * num_frames
         
-        for i in range(num_frames):
-            # Create a surface with a gradient color based on frame number
-            surface = pygame.Surface((800, 600))
+        self.num_frames = len(self.frames)
+        self._build_frame_lookup()
+        print(f"Created {self.num_frames} default animation frames")
+    
+    def _render_default_frame(self, frame_index):
+        """
+        Render a default frame - its gradient color and frame number
+        
+        Args:
+            frame_index (int): Index of the frame to render
             
-            # Calculate color gradient (blue to red)
-            normalized = i / (num_frames - 1)
-            r = int(255 * normalized)
-            b = int(255 * (1 - normalized))
-            g = int(100 * (0.5 - abs(0.5 - normalized)))
+        Returns:
+            pygame.Surface: The frame surface
+        """
+        # One font for every frame's label, created with the first frame
+        if self._default_font is None:
+            self._default_font = pygame.font.Font(None, 72)
+        
+        surface = pygame.Surface((800, 600))
+        surface.fill(self._default_colors[frame_index])
+        
+        # Add frame number text
+        text = self._default_font.render(f"Frame {frame_index+1}/{self.num_frames}", True, (255, 255, 255))
+        text_rect = text.get_rect(center=(400, 300))
+        surface.blit(text, text_rect)
+        
+        return self._to_display_format(self._scale_to_target(surface))
+    
+    def _build_frame_lookup(self):
+        """Precompute the frame index for every PCT_STEPS-th of a percent of decay"""
+        last = self.num_frames - 1
+        self._pct_to_frame = [
+            max(0, min(last, int((100 - p / PCT_STEPS) / 100 * last)))
+            for p in range(100 * PCT_STEPS + 1)
+        ]
+    
+    def _scale_to_target(self, surface):
+        """
+        Scale a frame to the target width, maintaining aspect ratio
+        
+        Args:
+            surface (pygame.Surface): Frame at its original size
             
-            surface.fill((r, g, b))
+        Returns:
+            pygame.Surface: Scaled frame, or the original if no target width is set
+        """
+        if not self.target_width:
+            return surface
+        
+        original_width = surface.get_width()
+        original_height = surface.get_height()
+        scale_factor = self.target_width / original_width
+        
+        # Within 1% of the target the difference isn't visible - skip the resample
+        if abs(scale_factor - 1.0) < 0.01:
+            return surface
+        new_width = int(original_width * scale_factor)
+        new_height = int(original_height * scale_factor)
+        return pygame.transform.smoothscale(surface, (new_width, new_height))
+    
+    def _to_display_format(self, surface, alpha=False):
+        """
+        Convert a surface to the display's pixel format so blits don't convert it
+        
+        Args:
+            surface (pygame.Surface): Surface to convert
+            alpha (bool): Whether to keep per-pixel alpha
             
-            # Add frame number text
-            font = pygame.font.Font(None, 72)
-            text = font.render(f"Frame {i+1}/{num_frames}", True, (255, 255, 255))
-            text_rect = text.get_rect(center=(400, 300))
-            surface.blit(text, text_rect)
+        Returns:
+            pygame.Surface: Converted surface, or the original if no display is set
+        """
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha() if alpha else surface.convert()
+    
+    def _load_frame(self, frame_index):
+        """
+        Decode a DISSOLVE frame, using the background prefetch if it has it
+        
+        Args:
+            frame_index (int): Index of the frame to load
             
-            # Add to frame list
-            self.frames.append(surface)
+        Returns:
+            pygame.Surface: The frame surface, or None if it failed to load
+        """
+        file_path = self._frame_paths[frame_index]
+        try:
+            if frame_index == self._prefetch_index:
+                surface = self._prefetch_future.result()
+            else:
+                surface = pygame.image.load(file_path)
+        except Exception as e:
+            print(f"Error loading frame {file_path}: {e}")
+            return None
         
-        self.num_frames = len(self.frames)
-        print(f"Created {self.num_frames} default animation frames")
+        # Convert here on the main thread, once, rather than on every blit
+        return self._to_display_format(self._scale_to_target(surface), alpha=True)
+    
+    def _prefetch(self, frame_index):
+        """
+        Start decoding a DISSOLVE frame on the background thread
+        
+        Args:
+            frame_index (int): Index of the frame to prefetch
+        """
+        if (frame_index >= self.num_frames or frame_index in self._frame_cache
+                or frame_index == self._prefetch_index):
+            return
+        self._prefetch_index = frame_index
+        self._prefetch_future = self._executor.submit(pygame.image.load, self._frame_paths[frame_index])
     
     def get_frame(self, frame_index):
         """
@@ -145,12 +286,30 @@ class BlenderAnimation:
         Returns:
             pygame.Surface: The frame surface
         """
-        if not self.frames:
+        if not self.num_frames:
             return None
             
         # Ensure frame_index is within valid range
-        frame_index = max(0, min(len(self.frames) - 1, frame_index))
-        return self.frames[frame_index]
+        frame_index = max(0, min(self.num_frames - 1, frame_index))
+        if self.frames:
+            frame = self.frames[frame_index]
+            if frame is None:
+                frame = self.frames[frame_index] = self._render_default_frame(frame_index)
+            return frame
+        
+        cache = self._frame_cache
+        if frame_index in cache:
+            cache.move_to_end(frame_index)
+            frame = cache[frame_index]
+        else:
+            frame = self._load_frame(frame_index)
+            cache[frame_index] = frame
+            if len(cache) > FRAME_CACHE_SIZE:
+                cache.popitem(last=False)
+        
+        # Decay moves forward through the frames, so the next one is needed next
+        self._prefetch(frame_index + 1)
+        return frame
     
     def get_current_frame(self):
         """
@@ -168,7 +327,7 @@ class BlenderAnimation:
         Args:
             amount (int): Number of frames to advance (can be negative to rewind)
         """
-        if not self.frames:
+        if not self.num_frames:
             return
             
         self.current_frame = (self.current_frame + amount) % self.num_frames
@@ -180,7 +339,7 @@ class BlenderAnimation:
         Args:
             frame_index (int): Index of the frame to set as current
         """
-        if not self.frames:
+        if not self.num_frames:
             return
             
         self.current_frame = max(0, min(self.num_frames - 1, frame_index))
@@ -192,13 +351,13 @@ class BlenderAnimation:
         Args:
             percentage (float): Percentage value (0-100)
         """
-        if not self.frames:
+        if not self.num_frames:
             return
             
         # Convert percentage to frame index
         # 100% decay = frame 0, 0% decay = last frame
-        frame_index = int((100 - percentage) / 100 * (self.num_frames - 1))
-        self.current_frame = max(0, min(self.num_frames - 1, frame_index))
+        step = int(percentage * PCT_STEPS)
+        self.current_frame = self._pct_to_frame[max(0, min(100 * PCT_STEPS, step))]
     
     def get_progress(self):
         """
@@ -207,7 +366,7 @@ class BlenderAnimation:
         Returns:
             float: Progress from 0.0 to 1.0
         """
-        if not self.frames or self.num_frames <= 1:
+        if self.num_frames <= 1:
             return 0
             
         return self.current_frame / (self.num_frames - 1)
@@ -215,6 +374,9 @@ class BlenderAnimation:
 class KeyboardKey:
     """Represents a key in the Keyboard Simon Says game"""
     
+    # Font for key names, shared by all keys and created with the first key
+    _font = None
+    
     def __init__(self, key, key_name, color, sound_id):
         """
         Initialize a key
@@ -229,21 +391,60 @@ class KeyboardKey:
         self.key_name = key_name  # Name to display
         self.color = color
         self.sound_id = sound_id
-        self.is_lit = False
-        self.lit_time = 0
-        self.lit_duration = 0.5  # Seconds to stay lit
+        # Lit state lives in Game3's _key_lit arrays, shared by all keys
+        
+        # Key name never changes, so render it once
+        if KeyboardKey._font is None:
+            KeyboardKey._font = pygame.font.Font(None, 36)
+        self._text_surface = KeyboardKey._font.render(key_name, True, (255, 255, 255))
+        
+        # Unlit and lit colors, recomputed only when decay moves noticeably
+        self._last_decay = -1
+        self._cached_base = None
+        self._cached_lit = None
+        
+        # Pre-rendered key faces keyed by (size, is_lit), cleared on recolor
+        self._surfaces = {}
     
-    def light_up(self):
-        """Light up the key"""
-        self.is_lit = True
-        self.lit_time = time.time()
+    def _set_colors(self, color):
+        """
+        Cache the unlit color and its brighter lit version
+        
+        Args:
+            color (tuple): Clamped RGB color with decay applied
+        """
+        self._cached_base = color
+        # If lit, make brighter
+        self._cached_lit = tuple(min(255, c + 100) for c in color)
+        self._surfaces.clear()
     
-    def update(self):
-        """Update key state"""
-        if self.is_lit and time.time() - self.lit_time > self.lit_duration:
-            self.is_lit = False
+    def _get_surface(self, size, is_lit):
+        """
+        Get the key face for a state, with fill, border and name baked
+        into one surface
+        
+        Args:
+            size (tuple): Width and height of the key
+            is_lit (bool): Whether the key is lit
+            
+        Returns:
+            pygame.Surface: Rendered key face
+        """
+        cache_key = (size, is_lit)
+        key_surface = self._surfaces.get(cache_key)
+        if key_surface is None:
+            color = self._cached_lit if is_lit else self._cached_base
+            key_surface = pygame.Surface(size)
+            key_rect = key_surface.get_rect()
+            key_surface.fill(color)
+            pygame.draw.rect(key_surface, (200, 200, 200), key_rect, 2)  # Border
+            key_surface.blit(self._text_surface, self._text_surface.get_rect(center=key_rect.center))
+            if pygame.display.get_surface() is not None:
+                key_surface = key_surface.convert()
+            self._surfaces[cache_key] = key_surface
+        return key_surface
     
-    def draw(self, surface, rect, decay_engine):
+    def draw(self, surface, rect, decay_engine, precomputed_color=None, is_lit=False):
         """
         Draw the key visualization
         
@@ -251,42 +452,46 @@ class KeyboardKey:
             surface (pygame.Surface): Surface to draw on
             rect (pygame.Rect): Rectangle defining position and size
             decay_engine (DecayEngine): Reference to the decay engine
+            precomputed_color (tuple, optional): Decayed color from
+                Game3.get_key_colors, computed here if not given
+            is_lit (bool): Whether the key is lit, from Game3._key_lit
         """
-        # Get base color, modified by global decay
-        color = decay_engine.get_decay_color(self.color)
-        
-        # Ensure valid color values
-        color = (
-            max(0, min(255, int(color[0]))),
-            max(0, min(255, int(color[1]))),
-            max(0, min(255, int(color[2])))
-        )
-        
-        # If lit, make brighter
-        if self.is_lit:
-            color = tuple(min(255, c + 100) for c in color)
-        
-        pygame.draw.rect(surface, color, rect)
-        pygame.draw.rect(surface, (200, 200, 200), rect, 2)  # Border
-        
-        # Draw key name
-        font = pygame.font.Font(None, 36)
-        text = font.render(self.key_name, True, (255, 255, 255))
-        text_rect = text.get_rect(center=rect.center)
-        surface.blit(text, text_rect)
+        if precomputed_color is not None:
+            if precomputed_color != self._cached_base:
+                self._set_colors(precomputed_color)
+        else:
+            decay_percentage = decay_engine.decay_percentage
+            if abs(decay_percentage - self._last_decay) > 0.5:
+                # Get base color, modified by global decay
+                color = decay_engine.get_decay_color(self.color)
+                
+                # Ensure valid color values
+                self._set_colors((
+                    max(0, min(255, int(color[0]))),
+                    max(0, min(255, int(color[1]))),
+                    max(0, min(255, int(color[2])))
+                ))
+                self._last_decay = decay_percentage
+        
+        surface.blit(self._get_surface(rect.size, is_lit), rect)
 
 class SequenceItem:
     """Represents an item in the sequence with "Computer says" or "Press" instruction"""
-    def __init__(self, key_idx, should_press):
+    
+    __slots__ = ('key_idx', 'should_press', 'instruction')
+    
+    def __init__(self, key_idx, should_press, instruction):
         """
         Initialize a sequence item
         
         Args:
             key_idx (int): Index of the key in the keys list
             should_press (bool): Whether the player should press this key (True for "Computer says")
+            instruction (str): Instruction shown while this item is displayed
         """
         self.key_idx = key_idx
         self.should_press = should_press
+        self.instruction = instruction
 
 class Game3:
     """Keyboard Simon Says game with DISSOLVE animation frames synced to decay"""
@@ -302,22 +507,20 @@ class Game3:
         pygame.display.set_caption("Keyboard Simon Says")
         self.clock = pygame.time.Clock()
         
+        # Mouse motion is never used, so don't queue it at all
+        pygame.event.set_blocked(pygame.MOUSEMOTION)
+        
         # Load decay colors for consistent UI theming
         self.healthy_color, self.warning_color, self.decay_color = load_decay_colors()
         
         # Show loading message
-        loading_font = load_jetbrains_mono_font(24)
-        loading_text = loading_font.render("Loading Animation Frames...", True, self.healthy_color)
-        loading_rect = loading_text.get_rect(center=(screen_width // 2, screen_height // 2))
-        
-        # Draw loading screen
-        self.screen.fill((0, 0, 0))
-        self.screen.blit(loading_text, loading_rect)
-        pygame.display.flip()
+        self._loading_font = None
+        self.show_loading_message("Loading Animation Frames...")
         
         # Create Blender animation with the DISSOLVE frames
         frames_dir = os.path.join("assets", "blender", "animation")
-        self.animation = BlenderAnimation(frames_dir)
+        # Frames are drawn at 85% of the screen width, so scale them to that once
+        self.animation = BlenderAnimation(frames_dir, target_width=screen_width * 0.85)
         
         # Create a loading bar showing animation progress
         bar_width = 400
@@ -326,21 +529,15 @@ class Game3:
         bar_y = self.screen_height // 2 + 40
         
         # Show loading progress bar without animation preview
-        frames_loaded = len(self.animation.frames)
+        frames_loaded = self.animation.num_frames
         if frames_loaded > 0:
-            self.screen.fill((0, 0, 0))
-            loading_text = loading_font.render(f"Animation Loaded! ({frames_loaded} frames)", True, self.healthy_color)
-            self.screen.blit(loading_text, loading_rect)
+            self.show_loading_message(f"Animation Loaded! ({frames_loaded} frames)", flip=False)
             pygame.draw.rect(self.screen, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height))
             pygame.draw.rect(self.screen, self.healthy_color, (bar_x, bar_y, bar_width, bar_height))
             pygame.display.flip()
-            pygame.time.delay(500)  # Brief pause to show completion
         
         # Load UI and game elements
-        self.screen.fill((0, 0, 0))
-        loading_text = loading_font.render("Creating Game Elements...", True, self.healthy_color)
-        self.screen.blit(loading_text, loading_rect)
-        pygame.display.flip()
+        self.show_loading_message("Creating Game Elements...")
         
         # Create decay bar - full width at bottom
         self.decay_bar = DecayBar(pygame.Rect(0, screen_height - 40, screen_width, 30), decay_engine, full_width=True)
@@ -349,6 +546,12 @@ class Game3:
         self.font = load_jetbrains_mono_font(24)
         self.large_font = load_jetbrains_mono_font(32)
         
+        # Rendered text surfaces keyed by (text, color), least recently used first
+        self._text_cache = OrderedDict()
+        
+        # Wrapped and rendered message lines keyed by (message, box center)
+        self._wrap_cache = {}
+        
         # Create keyboard keys for Simon Says
         self.keys = [
             KeyboardKey(pygame.K_w, "W", (255, 0, 0), 0),    # Red - W
@@ -360,6 +563,19 @@ class Game3:
         # Mapping of key codes to indices for easy lookup
         self.key_map = {key.key: i for i, key in enumerate(self.keys)}
         
+        # Decayed key colors, shared by all keys and recomputed when decay changes
+        self._key_base_colors = np.array([key.color for key in self.keys], dtype=np.uint8)
+        self._key_draw_colors = []
+        self._key_colors_decay = None
+        
+        # Lit state for every key, updated in one vectorized pass per frame
+        self._key_lit = np.zeros(len(self.keys), dtype=bool)
+        self._key_lit_times = np.zeros(len(self.keys))
+        self.key_lit_duration = 0.5  # Seconds a key stays lit
+        
+        # Random number generator for level sequences
+        self._rng = np.random.default_rng()
+        
         # Game states
         self.SHOWING_SEQUENCE = 0
         self.WAITING_FOR_PLAYER = 1
@@ -370,11 +586,29 @@ class Game3:
         self.wrong_prefix = "Press"  # Changed from "Click" to "Press" to avoid confusion
         self.current_instruction = ""
         
+        # Instruction box colors - per message, and darkened healthy/warning/decay
+        # colors for normal instructions
+        self._message_bg_colors = {}
+        self._normal_bg_colors = tuple(
+            (max(0, r - 100), max(0, g - 100), max(0, b - 50))  # Darker for better text contrast
+            for r, g, b in (self.healthy_color, self.warning_color, self.decay_color)
+        )
+        self._normal_bg_range = (0, 0)  # Decay range the cached color is valid for
+        self._normal_bg_color = None
+        
+        # Every possible sequence instruction, indexed by [should_press][key_idx]
+        self._instructions = {
+            should_press: [f"{prefix} {key.key_name}" for key in self.keys]
+            for should_press, prefix in ((True, self.correct_prefix), (False, self.wrong_prefix))
+        }
+        
         # Game state initialization
         self.state = self.SHOWING_SEQUENCE
         self.sequence = []  # List of SequenceItem objects
-        self.player_keys = []  # List of key indices the player has pressed
-        self.expected_player_keys = []  # List of key indices player should press (only "Computer says" ones)
+        # Key indices are stored as compact typed int8 arrays
+        self.player_keys = array('b')  # Key indices the player has pressed
+        self.expected_player_keys = array('b')  # Key indices player should press (only "Computer says" ones)
+        self._prefix_ok = True  # Whether every key pressed so far was the expected one
         self.sequence_index = 0
         self.next_item_time = 0
         self.sequence_delay = 0.8  # Seconds between keys in sequence
@@ -386,6 +620,14 @@ class Game3:
         self.player_timeout = 3.0  # Seconds to wait after last key press before checking completion
         self.is_timeout_active = False
         
+        # Timeout bar, above the "Keys pressed" text
+        bar_width = 400
+        self._timeout_bar_rect = pygame.Rect((self.screen_width - bar_width) // 2, self.screen_height - 150, bar_width, 10)
+        
+        # Timeout bar color indexed by ceil(percentage): decay up to 33%,
+        # warning up to 66%, healthy above
+        self._timeout_colors = [self.decay_color] * 34 + [self.warning_color] * 33 + [self.healthy_color] * 34
+        
         # Decay adjustment amounts (percentage points)
         self.correct_decay_bonus = 5.0  # Decrease decay by this much for correct answers
         self.wrong_decay_penalty = -2.0  # Increase decay by this much for wrong answers
@@ -398,30 +640,123 @@ class Game3:
         # For calculating delta time
         self.last_time = pygame.time.get_ticks()
         
-        # Back button
+        # Game time in seconds, read once per frame in update
+        self._now = self.last_time * 0.001
+        
+        # Back button - layout never changes, so render it once
         self.back_button = None
+        self._back_button_rect = pygame.Rect(self.screen_width - 100, 20, 80, 30)
+        self._back_button_surface = pygame.Surface(self._back_button_rect.size).convert()
+        
+        # Black background
+        self._back_button_surface.fill((0, 0, 0))
+        
+        # Green outline (2 pixels thick)
+        pygame.draw.rect(self._back_button_surface, (255, 255, 255), self._back_button_surface.get_rect(), 2)
+        
+        # Green text
+        back_text = self.font.render("Back", True, (255, 255, 255))
+        self._back_button_surface.blit(back_text, back_text.get_rect(center=self._back_button_surface.get_rect().center))
+        
+        # Stats text, re-rendered only when level or score changes
+        self._stats_key = None
+        self._stats_surface = None
+        
+        # "Keys pressed" text, re-rendered only when the pressed keys change
+        self._pressed_keys = None
+        self._pressed_surface = None
+        self._pressed_rect = None
+        
+        # Key controls info text, also rendered once
+        info_text = "Keys: W, A, S, D | Press SPACE when done | ESC to exit"
+        self._info_surface = self.font.render(info_text, True, (180, 180, 180))
+        self._info_pos = (self.screen_width - self._info_surface.get_width() - 20, self.screen_height - 80)
+        
+        # Where animation frames are centered
+        self._frame_center = (self.screen_width // 2, self.screen_height // 2 - 40)
+        
+        # Frames are only redrawn when something visible has changed
+        self._dirty = True
+        self._drawn_state = None
         
         # Sync animation with current decay percentage
+        self._last_synced_decay = -1
         self.sync_animation_with_decay()
         
         # Show ready message
+        self.show_loading_message("Game Ready!")
+    
+    def show_loading_message(self, message, flip=True):
+        """
+        Show a centered loading message on a black screen
+        
+        Messages are rendered once and reused on later visits to the game.
+        
+        Args:
+            message (str): Message to show
+            flip (bool): Whether to update the display immediately
+        """
+        key = (message, self.healthy_color)
+        text = _LOADING_TEXT_CACHE.get(key)
+        if text is None:
+            if self._loading_font is None:
+                self._loading_font = load_jetbrains_mono_font(24)
+            text = self._loading_font.render(message, True, self.healthy_color)
+            _LOADING_TEXT_CACHE[key] = text
+        
         self.screen.fill((0, 0, 0))
-        ready_text = loading_font.render("Game Ready!", True, self.healthy_color)
-        ready_rect = ready_text.get_rect(center=(screen_width // 2, screen_height // 2))
-        self.screen.blit(ready_text, ready_rect)
-        pygame.display.flip()
-        pygame.time.delay(300)  # Brief pause
+        self.screen.blit(text, text.get_rect(center=(self.screen_width // 2, self.screen_height // 2)))
+        if flip:
+            pygame.display.flip()
     
     def sync_animation_with_decay(self):
         """
         Sync the animation frame with the current decay percentage
         """
-        if hasattr(self, 'animation') and self.animation.frames:
-            decay_percentage = self.decay_engine.decay_percentage
+        decay_percentage = self.decay_engine.decay_percentage
+        
+        # Nothing to do if decay hasn't moved since the last sync
+        if decay_percentage == self._last_synced_decay:
+            return
+        
+        if hasattr(self, 'animation') and self.animation.num_frames:
             self.animation.set_frame_by_percentage(decay_percentage)
-            # Only print debug info occasionally to avoid console spam
-            if random.random() < 0.01:  # 1% chance to print
-                print(f"Synced animation to decay: {decay_percentage}% -> Frame {self.animation.current_frame}")
+            self._last_synced_decay = decay_percentage
+    
+    def get_key_colors(self):
+        """
+        Get every key's color with the global decay applied, in one vectorized
+        pass per decay change rather than once per key per frame
+        
+        Returns:
+            list: Clamped RGB color per key, in the same order as self.keys
+        """
+        decay_percentage = self.decay_engine.decay_percentage
+        if decay_percentage != self._key_colors_decay:
+            colors = self.decay_engine.get_decay_colors(self._key_base_colors)
+            self._key_draw_colors = [tuple(color) for color in colors.tolist()]
+            self._key_colors_decay = decay_percentage
+        return self._key_draw_colors
+    
+    def light_up_key(self, key_idx, now):
+        """
+        Light up a key
+        
+        Args:
+            key_idx (int): Index of the key in self.keys
+            now (float): Current game time in seconds
+        """
+        self._key_lit[key_idx] = True
+        self._key_lit_times[key_idx] = now
+    
+    def update_keys(self, now):
+        """
+        Turn off every key that has been lit for longer than key_lit_duration
+        
+        Args:
+            now (float): Current game time in seconds
+        """
+        self._key_lit &= (now - self._key_lit_times) <= self.key_lit_duration
     
     def start_new_level(self, is_reset=False):
         """
@@ -436,19 +771,19 @@ class Game3:
             
         # Generate sequence for this level
         self.sequence = []
-        self.expected_player_keys = []
+        self.expected_player_keys = array('b')
         
         # Sequence length based on level (minimum 3 items)
         sequence_length = max(3, self.level + 2)
         
-        for _ in range(sequence_length):
-            # Random key index
-            key_idx = random.randint(0, len(self.keys) - 1)
-            # 70% chance of "Computer says" (player should press)
-            should_press = random.random() < 0.7
-            
+        # Random key indices, each with a 70% chance of "Computer says"
+        # (player should press), drawn for the whole sequence at once
+        key_idxs = self._rng.integers(0, len(self.keys), size=sequence_length).tolist()
+        should_presses = (self._rng.random(sequence_length) < 0.7).tolist()
+        
+        for key_idx, should_press in zip(key_idxs, should_presses):
             # Create sequence item
-            sequence_item = SequenceItem(key_idx, should_press)
+            sequence_item = SequenceItem(key_idx, should_press, self._instructions[should_press][key_idx])
             self.sequence.append(sequence_item)
             
             # If this is a "Computer says" item, add to expected keys
@@ -458,27 +793,29 @@ class Game3:
         # Ensure there's at least one key to press
         if not self.expected_player_keys:
             # Add one mandatory "Computer says" item
-            key_idx = random.randint(0, len(self.keys) - 1)
-            self.sequence.append(SequenceItem(key_idx, True))
+            key_idx = int(self._rng.integers(0, len(self.keys)))
+            self.sequence.append(SequenceItem(key_idx, True, self._instructions[True][key_idx]))
             self.expected_player_keys.append(key_idx)
         
         # Reset player keys and sequence index
-        self.player_keys = []
+        self.player_keys = array('b')
+        self._prefix_ok = True
         self.sequence_index = 0
         
         # Set state to showing sequence
         self.state = self.SHOWING_SEQUENCE
-        self.next_item_time = time.time() + 0.5  # Start after a short delay
+        self.next_item_time = self._now + 0.5  # Start after a short delay
         
         # Clear instruction
         self.current_instruction = "Watch the sequence..."
         
         # Debug print
-        print(f"New level {self.level} sequence created:")
-        for i, item in enumerate(self.sequence):
-            prefix = "Computer says" if item.should_press else "Press only"
-            print(f"  {i+1}: {prefix} {self.keys[item.key_idx].key_name}")
-        print(f"Expected player keys: {[self.keys[idx].key_name for idx in self.expected_player_keys]}")
+        if DEBUG:
+            print(f"New level {self.level} sequence created:")
+            for i, item in enumerate(self.sequence):
+                prefix = "Computer says" if item.should_press else "Press only"
+                print(f"  {i+1}: {prefix} {self.keys[item.key_idx].key_name}")
+            print(f"Expected player keys: {[self.keys[idx].key_name for idx in self.expected_player_keys]}")
     
     def update_game(self, delta_time):
         """
@@ -492,11 +829,11 @@ class Game3:
         """
         decay_change = 0.0
         
-        current_time = time.time()
+        # Game time for this frame, read once in update()
+        current_time = self._now
         
         # Update all keys
-        for key in self.keys:
-            key.update()
+        self.update_keys(current_time)
         
         # Handle different game states
         if self.state == self.SHOWING_SEQUENCE:
@@ -507,12 +844,10 @@ class Game3:
                     sequence_item = self.sequence[self.sequence_index]
                     
                     # Light up the key
-                    self.keys[sequence_item.key_idx].light_up()
+                    self.light_up_key(sequence_item.key_idx, current_time)
                     
                     # Show instruction with appropriate prefix
-                    prefix = self.correct_prefix if sequence_item.should_press else self.wrong_prefix
-                    key_name = self.keys[sequence_item.key_idx].key_name
-                    self.current_instruction = f"{prefix} {key_name}"
+                    self.current_instruction = sequence_item.instruction
                     
                     # Move to next item
                     self.sequence_index += 1
@@ -524,8 +859,9 @@ class Game3:
                     self.is_timeout_active = False
                     
                     # Debug: Print out expected keys for developer reference
-                    expected_keys = [self.keys[idx].key_name for idx in self.expected_player_keys]
-                    print(f"Expected keys: {expected_keys}")
+                    if DEBUG:
+                        expected_keys = [self.keys[idx].key_name for idx in self.expected_player_keys]
+                        print(f"Expected keys: {expected_keys}")
                     
                     # Add "Done" button instruction if there are expected keys
                     if self.expected_player_keys:
@@ -566,58 +902,54 @@ class Game3:
             if not self.player_keys:
                 # Correct - player didn't press any keys
                 self.result_message = "Correct! You correctly didn't press any keys."
-                self.result_display_time = time.time()
+                self.result_display_time = self._now
                 self.state = self.SHOWING_RESULT
                 return self.correct_decay_bonus
             else:
                 # Wrong - player pressed keys when they shouldn't have
                 self.result_message = "Wrong! You shouldn't have pressed any keys."
-                self.result_display_time = time.time()
+                self.result_display_time = self._now
                 self.state = self.SHOWING_RESULT
                 return self.wrong_decay_penalty
                 
+        # handle_key_press already checked each key as it was pressed
+        n_player = len(self.player_keys)
+        n_expected = len(self.expected_player_keys)
+        
         # If player pressed fewer keys than expected
-        if len(self.player_keys) < len(self.expected_player_keys):
+        if n_player < n_expected:
             # Check if the keys they did press were correct
-            correct_so_far = True
-            for i, key_idx in enumerate(self.player_keys):
-                if key_idx != self.expected_player_keys[i]:
-                    correct_so_far = False
-                    break
+            correct_so_far = self._prefix_ok
             
             if correct_so_far:
                 # They pressed the right keys, just not all of them
                 missed_keys = len(self.expected_player_keys) - len(self.player_keys)
                 self.result_message = f"Incorrect! You missed {missed_keys} key(s)."
-                self.result_display_time = time.time()
+                self.result_display_time = self._now
                 self.state = self.SHOWING_RESULT
                 return self.wrong_decay_penalty / 2  # Smaller penalty
             else:
                 # They pressed the wrong keys
                 self.result_message = "Wrong! You pressed the wrong keys."
-                self.result_display_time = time.time() 
+                self.result_display_time = self._now
                 self.state = self.SHOWING_RESULT
                 return self.wrong_decay_penalty
         
         # If player pressed exactly the right keys
-        if len(self.player_keys) == len(self.expected_player_keys):
-            all_correct = True
-            for i, key_idx in enumerate(self.player_keys):
-                if key_idx != self.expected_player_keys[i]:
-                    all_correct = False
-                    break
+        if n_player == n_expected:
+            all_correct = self._prefix_ok
             
             if all_correct:
                 # Player got all keys correct
                 self.score += len(self.expected_player_keys) * 10
                 self.result_message = "Correct! Level complete!"
-                self.result_display_time = time.time()
+                self.result_display_time = self._now
                 self.state = self.SHOWING_RESULT
                 return self.correct_decay_bonus
             else:
                 # Player pressed wrong keys
                 self.result_message = "Wrong! You pressed the wrong keys."
-                self.result_display_time = time.time()
+                self.result_display_time = self._now
                 self.state = self.SHOWING_RESULT
                 return self.wrong_decay_penalty
         
@@ -639,54 +971,58 @@ class Game3:
         
         # Special case for SPACE key: player indicates they're done
         if key_code == pygame.K_SPACE:
-            print("Player pressed SPACE to indicate completion")
+            if DEBUG:
+                print("Player pressed SPACE to indicate completion")
             return self.check_player_completion()
             
         # Map key to our key index
-        if key_code not in self.key_map:
+        key_idx = self.key_map.get(key_code, -1)
+        if key_idx < 0:
             return 0.0  # Not one of our Simon keys
-            
-        key_idx = self.key_map[key_code]
         
         # Light up the key
-        self.keys[key_idx].light_up()
+        self.light_up_key(key_idx, self._now)
         
         # Add to player keys
         self.player_keys.append(key_idx)
+        self._dirty = True  # "Keys pressed" text changes
         
         # Update last key time and activate timeout
-        self.last_key_time = time.time()
+        self.last_key_time = self._now
         self.is_timeout_active = True
         
         # Log for debugging
         current_key_index = len(self.player_keys) - 1
-        print(f"Player pressed key: {self.keys[key_idx].key_name}")
-        print(f"Current index: {current_key_index}, Total expected: {len(self.expected_player_keys)}")
+        if DEBUG:
+            print(f"Player pressed key: {self.keys[key_idx].key_name}")
+            print(f"Current index: {current_key_index}, Total expected: {len(self.expected_player_keys)}")
         
         # Check if there are expected keys to press
         if not self.expected_player_keys:
             self.result_message = "Wrong! There were no keys to press in this sequence."
-            self.result_display_time = time.time()
+            self.result_display_time = self._now
             self.state = self.SHOWING_RESULT
             return self.wrong_decay_penalty
         
         # Check if the player has pressed too many keys
         if len(self.player_keys) > len(self.expected_player_keys):
             self.result_message = "Wrong! You pressed too many keys."
-            self.result_display_time = time.time()
+            self.result_display_time = self._now
             self.state = self.SHOWING_RESULT
             return self.wrong_decay_penalty
         
         # Check if the current key is correct
         current_expected_key = self.expected_player_keys[current_key_index]
+        self._prefix_ok = self._prefix_ok and key_idx == current_expected_key
         if key_idx != current_expected_key:
             # Wrong key pressed
-            print(f"Wrong key! Expected {self.keys[current_expected_key].key_name} but got {self.keys[key_idx].key_name}")
+            if DEBUG:
+                print(f"Wrong key! Expected {self.keys[current_expected_key].key_name} but got {self.keys[key_idx].key_name}")
             self.result_message = f"Wrong! You pressed {self.keys[key_idx].key_name} instead of {self.keys[current_expected_key].key_name}."
-            self.result_display_time = time.time()
+            self.result_display_time = self._now
             self.state = self.SHOWING_RESULT
             return self.wrong_decay_penalty
-        else:
+        elif DEBUG:
             print(f"Correct key: {self.keys[key_idx].key_name}")
         
         # If player has pressed all expected keys
@@ -694,7 +1030,7 @@ class Game3:
             # Sequence completed correctly
             self.score += len(self.expected_player_keys) * 10
             self.result_message = "Correct! Level complete!"
-            self.result_display_time = time.time()
+            self.result_display_time = self._now
             self.state = self.SHOWING_RESULT
             return self.correct_decay_bonus
         
@@ -703,20 +1039,131 @@ class Game3:
     
     def draw_back_button(self, surface):
         """Draw the back button with green outline, black middle and green text"""
-        button_rect = pygame.Rect(self.screen_width - 100, 20, 80, 30)
+        # The whole button is pre-rendered in __init__
+        surface.blit(self._back_button_surface, self._back_button_rect)
+        return self._back_button_rect
+    
+    def _render_cached(self, text, color=(255, 255, 255)):
+        """
+        Render text with the standard font, reusing the surface from an
+        earlier frame when the same text and color were rendered before
         
-        # Black background
-        pygame.draw.rect(surface, (0, 0, 0), button_rect)
+        Args:
+            text (str): Text to render
+            color (tuple): RGB text color
+            
+        Returns:
+            pygame.Surface: Rendered text
+        """
+        key = (text, color)
+        cache = self._text_cache
+        surf = cache.get(key)
+        if surf is None:
+            surf = self.font.render(text, True, color)
+            cache[key] = surf
+            if len(cache) > TEXT_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return surf
+    
+    def _classify_message(self, message):
+        """
+        Work out the instruction box color for a message from its content,
+        remembering the answer since the same messages repeat every level
         
-        # Green outline (2 pixels thick)
-        pygame.draw.rect(surface, (255, 255, 255), button_rect, 2)
+        Args:
+            message (str): Message to show
+            
+        Returns:
+            tuple: Background color, or None for normal instructions whose
+                color follows the current decay state
+        """
+        # Determine background color based on message content and using decay colors
+        if "Wrong" in message or "Incorrect" in message:
+            # For wrong answers - darker version of decay color (red-tinted)
+            r, g, b = self.decay_color
+            bg_color = (min(255, r + 80), max(0, g - 70), max(0, b - 70))  # Reddish tint
+        elif "Correct" in message:
+            # For correct answers - darker version of healthy color (green-tinted)
+            r, g, b = self.healthy_color
+            bg_color = (max(0, r - 70), min(255, g + 30), max(0, b - 70))  # Greenish tint
+        elif self.correct_prefix in message:
+            # For "Computer says" - use healthy color (darker)
+            r, g, b = self.healthy_color
+            bg_color = (max(0, r - 70), max(0, g - 40), max(0, b - 70))  # Darker green
+        elif self.wrong_prefix in message:
+            # For "Press" - use warning color (darker)
+            r, g, b = self.warning_color
+            bg_color = (min(255, r - 30), max(0, g - 40), max(0, b - 120))  # Orangish
+        else:
+            # Normal instructions follow the decay state, see _normal_bg_colors
+            bg_color = None
         
-        # Green text
-        text = self.font.render("Back", True, (255, 255, 255))
-        text_rect = text.get_rect(center=button_rect.center)
-        surface.blit(text, text_rect)
+        if len(self._message_bg_colors) >= TEXT_CACHE_SIZE:
+            self._message_bg_colors.clear()
+        self._message_bg_colors[message] = bg_color
+        return bg_color
+    
+    def _wrap_to_width(self, message, max_width):
+        """
+        Greedily wrap a message into lines no wider than max_width pixels
+        
+        Args:
+            message (str): Message to wrap
+            max_width (int): Maximum line width in pixels
+            
+        Returns:
+            list: Text of each line
+        """
+        size = self.font.size
+        space_width = size(" ")[0]
+        lines = []
+        line = []
+        line_width = 0
+        for word in message.split():
+            word_width = size(word)[0]
+            if line and line_width + space_width + word_width > max_width:
+                lines.append(" ".join(line))
+                line = [word]
+                line_width = word_width
+            else:
+                line_width += (space_width if line else 0) + word_width
+                line.append(word)
+        if line:
+            lines.append(" ".join(line))
+        return lines
+    
+    def _wrap_and_render(self, message, box_rect):
+        """
+        Wrap a message to fit the instruction box and render its lines,
+        reusing the result for messages already laid out
+        
+        Args:
+            message (str): Message to show
+            box_rect (pygame.Rect): Box the message is centered in
+            
+        Returns:
+            list: (surface, rect) pair for each line
+        """
+        key = (message, box_rect.width, box_rect.centerx, box_rect.centery)
+        lines = self._wrap_cache.get(key)
+        if lines is not None:
+            return lines
+        
+        # Wrap to the box's inner width, then stack the lines around its center
+        texts = [self._render_cached(line) for line in self._wrap_to_width(message, box_rect.width - 40)]
+        line_height = self.font.get_linesize()
+        top = box_rect.centery - line_height * (len(texts) - 1) / 2
+        lines = [
+            (text, text.get_rect(center=(box_rect.centerx, round(top + i * line_height))))
+            for i, text in enumerate(texts)
+        ]
         
-        return button_rect
+        if len(self._wrap_cache) >= TEXT_CACHE_SIZE:
+            self._wrap_cache.clear()
+        self._wrap_cache[key] = lines
+        return lines
     
     def draw_stats(self, surface):
         """
@@ -725,18 +1172,18 @@ class Game3:
         Args:
             surface (pygame.Surface): Surface to draw on
         """
-        stats_text = f"Level: {self.level} | Score: {self.score}"
-        
         # Note: For the updated version, we're not showing animation frame stats
         # since it's now directly tied to the decay bar
         
-        stats_surface = self.font.render(stats_text, True, (255, 255, 255))
-        surface.blit(stats_surface, (20, self.screen_height - 80))
+        # Only re-render when level or score changes
+        stats_key = (self.level, self.score)
+        if stats_key != self._stats_key:
+            self._stats_surface = self._render_cached(f"Level: {self.level} | Score: {self.score}")
+            self._stats_key = stats_key
+        surface.blit(self._stats_surface, (20, self.screen_height - 80))
         
         # Draw info about key controls
-        info_text = "Keys: W, A, S, D | Press SPACE when done | ESC to exit"
-        info_surface = self.font.render(info_text , True, (180, 180, 180))
-        surface.blit(info_surface, (self.screen_width - info_surface.get_width() - 20, self.screen_height - 80))
+        surface.blit(self._info_surface, self._info_pos)
     
     def draw_instruction(self, surface):
         """
@@ -750,7 +1197,11 @@ class Game3:
         
         if not message:
             return
-            
+        
+        # Bind the drawing functions once for the calls below
+        draw_rect = pygame.draw.rect
+        blit = surface.blit
+        
         # Create a box for the message at the bottom of the screen (above the decay bar)
         box_width = self.screen_width - 40  # Wide box with small margins
         box_height = 60  # Slightly shorter box
@@ -763,110 +1214,59 @@ class Game3:
         # Get the decay percentage for color selection
         decay_percentage = self.decay_engine.decay_percentage
         
-        # Determine background color based on message content and using decay colors
-        if "Wrong" in message or "Incorrect" in message:
-            # For wrong answers - darker version of decay color (red-tinted)
-            r, g, b = self.decay_color
-            bg_color = (min(255, r + 80), max(0, g - 70), max(0, b - 70))  # Reddish tint
-        elif "Correct" in message:
-            # For correct answers - darker version of healthy color (green-tinted)
-            r, g, b = self.healthy_color
-            bg_color = (max(0, r - 70), min(255, g + 30), max(0, b - 70))  # Greenish tint
-        elif self.correct_prefix in message:
-            # For "Computer says" - use healthy color (darker)
-            r, g, b = self.healthy_color
-            bg_color = (max(0, r - 70), max(0, g - 40), max(0, b - 70))  # Darker green
-        elif self.wrong_prefix in message:
-            # For "Press" - use warning color (darker)
-            r, g, b = self.warning_color
-            bg_color = (min(255, r - 30), max(0, g - 40), max(0, b - 120))  # Orangish
+        # Background color based on message content, looked up per message
+        if message in self._message_bg_colors:
+            bg_color = self._message_bg_colors[message]
         else:
-            # For normal instructions - use a darker shade of the current decay state
-            if decay_percentage > 66:
-                r, g, b = self.healthy_color
-            elif decay_percentage > 33:
-                r, g, b = self.warning_color
-            else:
-                r, g, b = self.decay_color
-            
-            # Make it darker for better text contrast
-            bg_color = (max(0, r - 100), max(0, g - 100), max(0, b - 50))
-        
-        pygame.draw.rect(surface, bg_color, box_rect)
-        pygame.draw.rect(surface, (200, 200, 200), box_rect, 2)  # Border
+            bg_color = self._classify_message(message)
+        if bg_color is None:
+            # For normal instructions - use a darker shade of the current decay state,
+            # picked again only when decay leaves the current third
+            low, high = self._normal_bg_range
+            if not low < decay_percentage <= high:
+                if decay_percentage > 66:
+                    bucket, self._normal_bg_range = 0, (66, float('inf'))
+                elif decay_percentage > 33:
+                    bucket, self._normal_bg_range = 1, (33, 66)
+                else:
+                    bucket, self._normal_bg_range = 2, (float('-inf'), 33)
+                self._normal_bg_color = self._normal_bg_colors[bucket]
+            bg_color = self._normal_bg_color
         
-        # Always use standard font for better fitting and wrap text if needed
-        font_to_use = self.font
+        draw_rect(surface, bg_color, box_rect)
+        draw_rect(surface, (200, 200, 200), box_rect, 2)  # Border
         
-        # Text wrapping for long messages
-        if len(message) > 60:
-            # Split into two lines
-            words = message.split()
-            line1 = []
-            line2 = []
-            
-            # Distribute words evenly between lines
-            half_len = len(message) // 2
-            current_len = 0
-            
-            for word in words:
-                if current_len < half_len:
-                    line1.append(word)
-                    current_len += len(word) + 1
-                else:
-                    line2.append(word)
-            
-            # Render two lines of text
-            text1 = font_to_use.render(" ".join(line1), True, (255, 255, 255))
-            text2 = font_to_use.render(" ".join(line2), True, (255, 255, 255))
-            
-            # Position texts
-            text1_rect = text1.get_rect(center=(box_rect.centerx, box_rect.centery - 15))
-            text2_rect = text2.get_rect(center=(box_rect.centerx, box_rect.centery + 15))
-            
-            # Draw texts
-            surface.blit(text1, text1_rect)
-            surface.blit(text2, text2_rect)
-        else:
-            # Single line text
-            text = font_to_use.render(message, True, (255, 255, 255))
-            text_rect = text.get_rect(center=box_rect.center)
-            surface.blit(text, text_rect)
+        # Draw the (possibly wrapped) message lines in one batched blit
+        surface.blits(self._wrap_and_render(message, box_rect), doreturn=False)
         
         # Show which keys the player has pressed (positioned above the instruction box)
         if self.state == self.WAITING_FOR_PLAYER and self.player_keys:
-            pressed_text = "Keys pressed: " + " ".join([self.keys[idx].key_name for idx in self.player_keys])
-            pressed_surface = self.font.render(pressed_text, True, (200, 200, 200))
-            pressed_rect = pressed_surface.get_rect(center=(self.screen_width // 2, box_y - 20))
-            surface.blit(pressed_surface, pressed_rect)
+            # Only rebuilt when the player presses another key
+            pressed_keys = self.player_keys.tobytes()
+            if pressed_keys != self._pressed_keys:
+                pressed_text = "Keys pressed: " + " ".join([self.keys[idx].key_name for idx in self.player_keys])
+                self._pressed_surface = self._render_cached(pressed_text, (200, 200, 200))
+                self._pressed_rect = self._pressed_surface.get_rect(center=(self.screen_width // 2, box_y - 20))
+                self._pressed_keys = pressed_keys
+            blit(self._pressed_surface, self._pressed_rect)
             
             # Show timeout progress above keys pressed text
             if self.is_timeout_active:
                 # Calculate remaining time
-                current_time = time.time()
-                elapsed = current_time - self.last_key_time
+                elapsed = self._now - self.last_key_time
                 remaining = max(0, self.player_timeout - elapsed)
                 percentage = remaining / self.player_timeout * 100
                 
                 # Draw timeout bar
-                bar_width = 400
-                bar_height = 10
-                bar_x = (self.screen_width - bar_width) // 2
-                bar_y = box_y - 40
-                
-                # Background
-                pygame.draw.rect(surface, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height))
+                bar_x, bar_y, bar_width, bar_height = self._timeout_bar_rect
+                fill_width = int(bar_width * percentage / 100)
                 
                 # Fill with appropriate decay color based on timer
-                if percentage > 66:
-                    bar_color = self.healthy_color
-                elif percentage > 33:
-                    bar_color = self.warning_color
-                else:
-                    bar_color = self.decay_color
-                    
-                fill_width = int(bar_width * percentage / 100)
-                pygame.draw.rect(surface, bar_color, (bar_x, bar_y, fill_width, bar_height))
+                bar_color = self._timeout_colors[math.ceil(percentage)]
+                draw_rect(surface, bar_color, (bar_x, bar_y, fill_width, bar_height))
+                
+                # Background, only where the fill doesn't cover it
+                draw_rect(surface, (50, 50, 50), (bar_x + fill_width, bar_y, bar_width - fill_width, bar_height))
     
     def draw_keyboard(self, surface):
         """
@@ -877,10 +1277,12 @@ class Game3:
     
     def update(self):
         """Update game state and handle events"""
-        # Calculate delta time
+        # Calculate delta time, reading the clock once per frame;
+        # everything else this frame uses self._now
         current_time = pygame.time.get_ticks()
         delta_time = (current_time - self.last_time) / 1000.0  # Convert to seconds
         self.last_time = current_time
+        self._now = current_time * 0.001
         
         # Update decay naturally over time
         self.decay_engine.update(delta_time)
@@ -890,8 +1292,8 @@ class Game3:
         if decay_change != 0:
             self.decay_engine.modify_decay(decay_change)
         
-        # Handle events
-        for event in pygame.event.get():
+        # Handle events - only fetch the types handled here, drop the rest
+        for event in pygame.event.get(HANDLED_EVENTS):
             if event.type == pygame.QUIT:
                 return False
             elif event.type == pygame.KEYDOWN:
@@ -905,10 +1307,12 @@ class Game3:
                 if event.button == 1:  # Left click
                     pos = event.pos
                     
-                    # Check if back button was clicked
-                    if self.back_button and self.back_button.collidepoint(pos):
+                    # Check if back button was clicked - its rect never moves,
+                    # so test the precomputed one rather than the last drawn
+                    if self._back_button_rect.collidepoint(pos):
                         print("Back button clicked in Game3")
                         return "main_menu"
+        pygame.event.clear()
         
         # If this is the first frame, start the game
         if not self.sequence:
@@ -916,34 +1320,59 @@ class Game3:
         
         return True
     
+    def needs_redraw(self):
+        """
+        Check whether anything visible has changed since the last draw
+        
+        Returns:
+            bool: True if the frame should be redrawn
+        """
+        # The decay bar shows one decimal place, and the timeout bar moves a pixel at a time
+        timeout_width = -1
+        if self.state == self.WAITING_FOR_PLAYER and self.is_timeout_active:
+            remaining = max(0, self.player_timeout - (self._now - self.last_key_time))
+            timeout_width = int(self._timeout_bar_rect.width * remaining / self.player_timeout)
+        
+        state = (
+            int(self.decay_engine.decay_percentage * 10),
+            self.animation.current_frame,
+            self.state,
+            self.current_instruction,
+            self.result_message,
+            self.level,
+            self.score,
+            timeout_width
+        )
+        if state != self._drawn_state:
+            self._drawn_state = state
+            self._dirty = True
+        
+        dirty = self._dirty
+        self._dirty = False
+        return dirty
+    
     def draw(self):
         """Draw all game elements"""
+        screen = self.screen
+        
         # Fill background with black
-        self.screen.fill((0, 0, 0))
+        screen.fill((0, 0, 0))
         
         # Draw current animation frame - centered on screen for maximum visibility
         frame = self.animation.get_current_frame()
         if frame:
-            # Calculate a good size for the frame to be prominent
-            # Scale to 85% of the screen width, maintaining aspect ratio
-            original_width = frame.get_width()
-            original_height = frame.get_height()
-            scale_factor = self.screen_width * 0.85 / original_width
-            new_width = int(original_width * scale_factor)
-            new_height = int(original_height * scale_factor)
-            
-            scaled_frame = pygame.transform.scale(frame, (new_width, new_height))
+            # Frames are already scaled to 85% of the screen width on load
             # Center the frame on screen
-            frame_rect = scaled_frame.get_rect(center=(self.screen_width // 2, self.screen_height // 2 - 40))
-            self.screen.blit(scaled_frame, frame_rect)
+            frame_rect = frame.get_rect(center=self._frame_center)
+            screen.blit(frame, frame_rect)
         
         # No keyboard visualization as per user's request
         
         # Draw UI elements
-        self.decay_bar.draw(self.screen)
-        self.back_button = self.draw_back_button(self.screen)
-        self.draw_stats(self.screen)
-        self.draw_instruction(self.screen)  # Now moved to bottom of screen
+        self.decay_bar.draw(screen)
+        self.back_button = self.draw_back_button(screen)
+        self.draw_stats(screen)
+        self.draw_instruction(screen)  # Now moved to bottom of screen
     
     def run(self):
         """Run the game loop"""
@@ -963,8 +1392,10 @@ class Game3:
             elif isinstance(result, str):
                 return result
             
-            self.draw()
-            pygame.display.flip()
+            # Skip the full redraw and flip on frames where nothing changed
+            if self.needs_redraw():
+                self.draw()
+                pygame.display.flip()
             self.clock.tick(60)
         
         return None
\ No newline at end of file
@@ -3,7 +3,11 @@ generate_animation.py - Generate a simple animation for testing
 """
 import os
 import math
+import struct
+import zlib
+import numpy as np
 import pygame
+from concurrent.futures import ProcessPoolExecutor
 
 # Create directories if they don't exist
 def create_dirs():
@@ -13,9 +17,29 @@ def create_dirs():
         "assets/blender/animation"
     ]
     for dir_path in dirs:
-        if not os.path.exists(dir_path):
-            os.makedirs(dir_path)
-            print(f"Created directory: {dir_path}")
+        os.makedirs(dir_path, exist_ok=True)
+
+# PNG zlib level - these are throwaway test frames, so favor speed over size
+PNG_COMPRESS_LEVEL = 1
+
+# Encode one frame's pixels as a PNG - run in a worker process.
+# Written directly with zlib because pygame.image.save has no compression setting
+def _save_png(raw, size, file_path):
+    width, height = size
+    
+    # Each row of RGB pixels is preceded by filter type 0 (none)
+    rows = np.frombuffer(raw, dtype=np.uint8).reshape(height, width * 3)
+    scanlines = np.hstack([np.zeros((height, 1), dtype=np.uint8), rows]).tobytes()
+    
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+    
+    with open(file_path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))  # 8-bit RGB
+        f.write(chunk(b"IDAT", zlib.compress(scanlines, PNG_COMPRESS_LEVEL)))
+        f.write(chunk(b"IEND", b""))
+    return file_path
 
 # Generate frames with rotating shapes
 def generate_frames(num_frames=60, width=800, height=600):
@@ -28,44 +52,52 @@ def generate_frames(num_frames=60, width=800, height=600):
     # Create surface for drawing
     surface = pygame.Surface((width, height))
     
-    # Generate each frame
-    for i in range(num_frames):
-        # Clear surface
-        surface.fill((0, 0, 0))
-        
-        # Calculate animation progress
-        progress = i / num_frames
-        angle = progress * 2 * math.pi
-        
-        # Draw a rotating shape
-        center_x, center_y = width // 2, height // 2
-        radius = 150
-        
-        # Draw a polygon
-        points = []
-        num_points = 5  # Pentagon
-        for p in range(num_points):
-            point_angle = angle + (p * 2 * math.pi / num_points)
-            x = center_x + radius * math.cos(point_angle)
-            y = center_y + radius * math.sin(point_angle)
-            points.append((x, y))
-        
-        # Calculate color based on progress - FIX: Ensure values are between 0-255
-        r = int(abs(math.sin(progress * math.pi)) * 255)
-        g = int(abs(math.sin(progress * math.pi + math.pi/3)) * 255)
-        b = int(abs(math.sin(progress * math.pi + 2*math.pi/3)) * 255)
-        
-        # Draw shape
-        pygame.draw.polygon(surface, (r, g, b), points)
-        
-        # Draw frame number
-        text = font.render(f"Frame {i+1}/{num_frames}", True, (255, 255, 255))
-        surface.blit(text, (20, 20))
+    # Calculate animation progress for every frame
+    progress = np.arange(num_frames) / num_frames
+    angles = progress * 2 * math.pi
+    
+    # Vertices of a rotating shape, for every frame at once
+    center_x, center_y = width // 2, height // 2
+    radius = 150
+    num_points = 5  # Pentagon
+    point_angles = angles[:, None] + np.arange(num_points) * 2 * math.pi / num_points
+    vertices = np.stack([
+        center_x + radius * np.cos(point_angles),
+        center_y + radius * np.sin(point_angles)
+    ], axis=2).tolist()
+    
+    # Calculate color based on progress - FIX: Ensure values are between 0-255
+    phases = np.array([0, math.pi/3, 2*math.pi/3])
+    colors = (np.abs(np.sin(progress[:, None] * math.pi + phases)) * 255).astype(np.uint8).tolist()
+    
+    # Frame file names differ only by index
+    frame_path = os.path.join(frames_dir, "frame_{:03d}.png")
+    
+    # Generate each frame, handing PNG compression to a pool of worker processes
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = []
+        for i in range(num_frames):
+            # Clear surface
+            surface.fill((0, 0, 0))
+            
+            # Draw shape - filling the pentagon directly is far cheaper than
+            # rotating and tinting a pre-rendered copy of it each frame
+            pygame.draw.polygon(surface, colors[i], vertices[i])
+            
+            # Draw frame number
+            text = font.render(f"Frame {i+1}/{num_frames}", True, (255, 255, 255))
+            surface.blit(text, (20, 20))
+            
+            # Save frame
+            file_path = frame_path.format(i)
+            raw = pygame.image.tostring(surface, "RGB")
+            futures.append(executor.submit(_save_png, raw, (width, height), file_path))
         
-        # Save frame
-        file_path = os.path.join(frames_dir, f"frame_{i:03d}.png")
-        pygame.image.save(surface, file_path)
-        print(f"Generated: {file_path}")
+        # Wait for every frame, reporting progress every 10th one
+        for i, future in enumerate(futures):
+            file_path = future.result()
+            if i % 10 == 0 or i == num_frames - 1:
+                print(f"Generated: {file_path}")
 
 if __name__ == "__main__":
     create_dirs()
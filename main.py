@@ -109,6 +109,9 @@ import sys
 import pygame
 import time
 import random
+import multiprocessing
+from enum import IntEnum
+from concurrent.futures import ProcessPoolExecutor
 from terminal_intro import play_intro_animation
 from start_screen import run_start_screen
 from end_screen import run_end_screen
@@ -117,6 +120,7 @@ from decay_engine import DecayEngine
 from games.game1 import Game1
 from games.game2 import Game2
 from games.game3 import Game3
+from utils.blender_loader import ModelStore
 
 # Import OpenGL functions
 from OpenGL.GL import *
@@ -127,8 +131,28 @@ SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 FPS = 60
 
+# Print state transition and asset loading debug output (set DIGITAL_DECAY_DEBUG=1)
+DEBUG = os.environ.get("DIGITAL_DECAY_DEBUG") == "1"
+
+class State(IntEnum):
+    """Main loop states"""
+    MAIN_MENU = 0
+    GAME1 = 1
+    GAME2 = 2
+    GAME3 = 3
+
+# States by the names the menu's and games' run() return
+STATE_BY_NAME = {state.name.lower(): state for state in State}
+
+# Main loop flags - set when something outside the current state needs handling
+RESTART = 1  # Start a fresh game from the main menu
+SHOW_END_SCREEN = 2  # Decay reached zero
+
+# Full-screen black overlay for fades, converted to the display's format
+_fade_surface = None
+
 # Global preloaded assets
-preloaded_objects = {}
+preloaded_objects = ModelStore()
 
 def create_asset_directories():
     """Create necessary directories for assets if they don't exist"""
@@ -142,47 +166,108 @@ def create_asset_directories():
     ]
     
     for directory in directories:
-        if not os.path.exists(directory):
-            os.makedirs(directory)
-            print(f"Created directory: {directory}")
+        os.makedirs(directory, exist_ok=True)
 
-def preload_assets():
-    """Preload assets to avoid delays during transitions"""
-    global preloaded_objects
-    print("Preloading assets...")
-    
-    # Create temporary OpenGL context for preloading
-    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.DOUBLEBUF | pygame.OPENGL)
-    
-    # Setup OpenGL for preloading
+def setup_gl():
+    """Set up the OpenGL viewport and perspective projection"""
     glViewport(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
     glMatrixMode(GL_PROJECTION)
     glLoadIdentity()
     gluPerspective(45, (SCREEN_WIDTH / SCREEN_HEIGHT), 0.1, 50.0)
     glMatrixMode(GL_MODELVIEW)
     glLoadIdentity()
+
+def ensure_display_mode(opengl):
+    """
+    Switch the window to OpenGL or regular 2D mode, keeping the existing
+    window (and its GL context) when it is already in that mode
+    
+    Args:
+        opengl (bool): Whether the window should be in OpenGL mode
+        
+    Returns:
+        pygame.Surface: The display surface
+    """
+    screen = pygame.display.get_surface()
+    if (screen is not None and screen.get_size() == (SCREEN_WIDTH, SCREEN_HEIGHT)
+            and bool(screen.get_flags() & pygame.OPENGL) == opengl):
+        return screen
+    
+    if opengl:
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.DOUBLEBUF | pygame.OPENGL)
+        setup_gl()
+        return screen
+    return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+def present(dirty_rects):
+    """
+    Show this frame's changes - updating only the dirty rectangles when they
+    cover under a quarter of the screen, else flipping the whole display
+    
+    Not for OpenGL mode, where only flip() is allowed.
+    
+    Args:
+        dirty_rects (list): pygame.Rect areas changed since the last frame
+    """
+    dirty_area = sum(rect.width * rect.height for rect in dirty_rects)
+    if dirty_area < 0.25 * SCREEN_WIDTH * SCREEN_HEIGHT:
+        pygame.display.update(dirty_rects)
+    else:
+        pygame.display.flip()
+
+def get_fade_surface():
+    """
+    Get the full-screen black fade overlay, converting it again only when
+    the display's pixel format has changed since it was last converted
+    
+    Returns:
+        pygame.Surface: Opaque black surface matching the display format
+    """
+    global _fade_surface
+    display_surface = pygame.display.get_surface()
+    if (_fade_surface is None
+            or _fade_surface.get_bitsize() != display_surface.get_bitsize()
+            or _fade_surface.get_masks() != display_surface.get_masks()):
+        _fade_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        _fade_surface.fill((0, 0, 0))
+    return _fade_surface
+
+def preload_assets():
+    """Preload assets to avoid delays during transitions"""
+    global preloaded_objects
+    print("Preloading assets...")
+    
+    # No window or GL context is needed here - models are only parsed, and
+    # nothing is uploaded to the GPU until the main menu draws them
     
     # Preload Blender objects from the objects directory
-    from utils.blender_loader import BlenderModel
+    from utils.blender_loader import load_model, load_model_arrays
     
     obj_dir = os.path.join("assets", "blender", "objects")
     if os.path.exists(obj_dir):
-        for filename in os.listdir(obj_dir):
-            if filename.endswith('.obj'):
-                try:
-                    filepath = os.path.join(obj_dir, filename)
+        filenames = [filename for filename in os.listdir(obj_dir) if filename.endswith('.obj')]
+        
+        # Parse the OBJ files in parallel worker processes; models are
+        # built on this thread, which owns the GL context
+        with ProcessPoolExecutor(max_workers=max(1, min(len(filenames), os.cpu_count() or 1))) as executor:
+            futures = {}
+            for filename in filenames:
+                filepath = os.path.join(obj_dir, filename)
+                if DEBUG:
                     print(f"Preloading {filepath}...")
-                    model = BlenderModel(filepath)
+                futures[filename] = executor.submit(load_model_arrays, filepath)
+            
+            for filename, future in futures.items():
+                try:
+                    model = load_model(os.path.join(obj_dir, filename), future.result())
                     # Store the preloaded model
-                    preloaded_objects[filename] = model
+                    preloaded_objects.add(filename, model)
                 except Exception as e:
                     print(f"Error preloading {filename}: {e}")
     
-    # Clean up OpenGL context after preloading
-    pygame.display.quit()
-    pygame.display.init()
-    
-    print(f"Preloaded {len(preloaded_objects)} assets")
+    n = len(preloaded_objects)
+    print(f"Preloaded {n} assets ({preloaded_objects.vertex_counts[:n].sum()} vertices, "
+          f"{preloaded_objects.face_counts[:n].sum()} faces)")
 
 def check_decay_for_end_screen(decay_engine, current_state, game_over):
     """
@@ -198,10 +283,112 @@ def check_decay_for_end_screen(decay_engine, current_state, game_over):
     """
     # Force exact comparison with 0.0 to ensure we catch it
     if decay_engine.decay_percentage <= 0.0 and not game_over and current_state != "end_screen":
-        print(f"DECAY DETECTED AT EXACTLY 0% - Showing end screen (from {current_state})")
+        if DEBUG:
+            print(f"DECAY DETECTED AT EXACTLY 0% - Showing end screen (from {current_state})")
         return "end_screen"
     return None
 
+class GameContext:
+    """State shared by the main loop and the state entry/tick functions"""
+    
+    def __init__(self, decay_engine, menu):
+        """
+        Initialize the context
+        
+        Args:
+            decay_engine (DecayEngine): The global decay engine
+            menu (MainMenu): The main menu
+        """
+        self.flags = 0  # RESTART / SHOW_END_SCREEN bits
+        self.use_decay_engine(decay_engine)
+        self.menu = menu
+        self.current_game = None  # Current active game
+        self.next_state = None
+        self.running = True
+        self.end_screen_shown = False  # Prevents loops between screens
+    
+    def use_decay_engine(self, decay_engine):
+        """
+        Switch to a decay engine, showing the end screen when it reaches zero
+        
+        Args:
+            decay_engine (DecayEngine): The global decay engine
+        """
+        self.decay_engine = decay_engine
+        decay_engine.on_zero = self.request_end_screen
+        if decay_engine.decay_percentage <= 0.0:
+            self.request_end_screen()
+    
+    def request_end_screen(self):
+        """Flag the main loop to show the end screen"""
+        self.flags |= SHOW_END_SCREEN
+
+def enter_main_menu(ctx):
+    """Prepare to go back to main menu"""
+    ensure_display_mode(opengl=True)
+    ctx.menu = MainMenu(ctx.decay_engine, preloaded_objects)
+
+def game_entry(game_class):
+    """
+    Build the entry function for a game state
+    
+    Args:
+        game_class (type): Game to create on entry
+        
+    Returns:
+        function: Entry function taking a GameContext
+    """
+    def enter_game(ctx):
+        # Switch to the game in regular display mode
+        ensure_display_mode(opengl=False)
+        ctx.current_game = game_class(ctx.decay_engine, SCREEN_WIDTH, SCREEN_HEIGHT)
+    return enter_game
+
+def handle_state_result(ctx, result):
+    """
+    Act on the value returned by the menu's or a game's run()
+    
+    Args:
+        ctx (GameContext): Main loop state
+        result (str or None): None to quit, otherwise the next state
+    """
+    if result is None:
+        ctx.running = False
+    elif result == "end_screen":
+        # Special handling for end_screen - let decay detection handle it
+        ctx.decay_engine.decay_percentage = 0.0
+        ctx.end_screen_shown = False
+        ctx.request_end_screen()
+    elif isinstance(result, str):
+        # Unknown names are kept as-is and ignored by the main loop
+        ctx.next_state = STATE_BY_NAME.get(result, result)
+
+def tick_main_menu(ctx):
+    """Run the main menu until it returns"""
+    handle_state_result(ctx, ctx.menu.run())
+
+def tick_game(ctx):
+    """Run the current game until it returns"""
+    if ctx.current_game:
+        handle_state_result(ctx, ctx.current_game.run())
+    else:
+        # If game object is missing, go back to menu
+        ctx.next_state = State.MAIN_MENU
+
+# Functions run when entering each state, and on each pass of the main loop in it
+STATE_ENTRY = {
+    State.MAIN_MENU: enter_main_menu,
+    State.GAME1: game_entry(Game1),
+    State.GAME2: game_entry(Game2),
+    State.GAME3: game_entry(Game3)
+}
+STATE_TICK = {
+    State.MAIN_MENU: tick_main_menu,
+    State.GAME1: tick_game,
+    State.GAME2: tick_game,
+    State.GAME3: tick_game
+}
+
 # Final fix for main.py - handling "end_screen" state transition correctly
 def main():
     """Main function to run the game"""
@@ -228,20 +415,17 @@ def main():
     
     # Simple fade out of start screen
     surface = pygame.display.get_surface()
-    fade_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-    fade_surface.fill((0, 0, 0))
+    fade_surface = get_fade_surface()
     
+    # The background is the same every step, so clear it once
+    surface.fill((0, 0, 0))
     for alpha in range(0, 256, 15):
-        surface.fill((0, 0, 0))
         fade_surface.set_alpha(alpha)
-        surface.blit(fade_surface, (0, 0))
-        pygame.display.flip()
-        pygame.time.delay(5)
+        present([surface.blit(fade_surface, (0, 0))])
+        clock.tick(120)
     
     # Switch to MainMenu (OpenGL mode)
-    pygame.display.quit()  
-    pygame.display.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.DOUBLEBUF | pygame.OPENGL)
+    ensure_display_mode(opengl=True)
     
     # Create main menu with preloaded objects
     menu = MainMenu(decay_engine, preloaded_objects)
@@ -252,185 +436,116 @@ def main():
         new_obj.position[0] = 20.0  # Much further off-screen to the right
     
     # Game state
-    current_state = "main_menu"
-    next_state = None
-    running = True
-    restart_flag = False
-    
-    # Current active game
-    current_game = None
-    
-    # Add a flag to prevent loops between screens
-    end_screen_shown = False
+    ctx = GameContext(decay_engine, menu)
+    current_state = State.MAIN_MENU
     
     # Main game loop
-    while running:
-        # Handle zero decay detection and the restart flag first
-        
-        # Check for restart flag - this is our way to handle the End -> Start -> Main flow
-        if restart_flag:
-            print("Detected restart flag - resetting and going to main menu")
-            restart_flag = False
-            current_state = "main_menu"
-
-            MainMenu.reset_state()
-            
-            # Make sure display is properly set up for main menu
-            pygame.display.quit()
-            pygame.display.init()
-            screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.DOUBLEBUF | pygame.OPENGL)
-            
-            # Create a new main menu with fresh decay engine
-            decay_engine = DecayEngine(decay_time=120)
-            menu = MainMenu(decay_engine, preloaded_objects)
-            end_screen_shown = False
-            
-            # Skip the rest of the loop
-            continue
+    while ctx.running:
+        # Handle the restart and end screen flags first - nothing to check
+        # in the usual case where neither is set
+        flags = ctx.flags
+        if flags:
+            ctx.flags = 0
             
-        # Check for zero decay
-        if decay_engine.decay_percentage <= 0.0 and not end_screen_shown:
-            print(f"DECAY DETECTED AT EXACTLY 0% - Showing end screen (from {current_state})")
-            end_screen_shown = True
-            
-            # If next_state is set to "end_screen", clear it to avoid confusion
-            if next_state == "end_screen":
-                next_state = None
-            
-            # Clean up current display
-            pygame.display.quit()
-            pygame.display.init()
-            
-            # Switch to regular display mode for end screen
-            screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-            
-            # Run end screen
-            print("Running end screen")
-            if run_end_screen():  # Returns True when user presses Enter or after 30 seconds
-                print("End screen complete - going to start screen")
+            # Restart is our way to handle the End -> Start -> Main flow
+            if flags & RESTART:
+                if DEBUG:
+                    print("Detected restart flag - resetting and going to main menu")
+                current_state = State.MAIN_MENU
+
+                MainMenu.reset_state()
                 
-                # Clean up resources
-                pygame.display.quit()
-                pygame.display.init()
+                # Make sure display is properly set up for main menu
+                ensure_display_mode(opengl=True)
                 
-                # Switch to regular display mode for start screen
-                screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+                # Create a new main menu with fresh decay engine
+                ctx.use_decay_engine(DecayEngine(decay_time=120))
+                ctx.menu = MainMenu(ctx.decay_engine, preloaded_objects)
+                ctx.end_screen_shown = False
                 
-                # Run start screen with a completely fresh decay engine
-                print("Running start screen")
-                if run_start_screen():
-                    # Reset main menu state when starting a fresh game
-                    MainMenu.reset_state()
-                    # User pressed Enter on start screen - set flag to restart the game
-                    restart_flag = True
-                    print("Start screen complete - setting restart flag")
-                else:
-                    # User pressed ESC on start screen - quit
-                    running = False
-            else:
-                # User pressed ESC on end screen - quit
-                running = False
+                # Skip the rest of the loop
+                continue
             
-            # Skip the rest of the loop
-            continue
+            # Decay reached zero
+            if flags & SHOW_END_SCREEN and not ctx.end_screen_shown:
+                if DEBUG:
+                    print(f"DECAY DETECTED AT EXACTLY 0% - Showing end screen (from {current_state.name.lower()})")
+                ctx.end_screen_shown = True
+                
+                # Switch to regular display mode for end screen
+                ensure_display_mode(opengl=False)
+                
+                # Run end screen
+                if DEBUG:
+                    print("Running end screen")
+                if run_end_screen():  # Returns True when user presses Enter or after 30 seconds
+                    if DEBUG:
+                        print("End screen complete - going to start screen")
+                    
+                    # Switch to regular display mode for start screen
+                    ensure_display_mode(opengl=False)
+                    
+                    # Run start screen with a completely fresh decay engine
+                    if DEBUG:
+                        print("Running start screen")
+                    if run_start_screen():
+                        # Reset main menu state when starting a fresh game
+                        MainMenu.reset_state()
+                        # User pressed Enter on start screen - set flag to restart the game
+                        ctx.flags |= RESTART
+                        if DEBUG:
+                            print("Start screen complete - setting restart flag")
+                    else:
+                        # User pressed ESC on start screen - quit
+                        ctx.running = False
+                else:
+                    # User pressed ESC on end screen - quit
+                    ctx.running = False
+                
+                # Skip the rest of the loop
+                continue
         
         # Process state transitions for normal game states (not end/start)
-        if next_state:
-            print(f"Transitioning from {current_state} to {next_state}")
+        # ("end_screen" never gets here - handle_state_result turns it into a flag)
+        next_state = ctx.next_state
+        if next_state is not None:
+            next_name = next_state.name.lower() if isinstance(next_state, State) else next_state
+            if DEBUG:
+                print(f"Transitioning from {current_state.name.lower()} to {next_name}")
             
-            # Special handling for end_screen transition
-            if next_state == "end_screen":
-                # This will be handled by the decay detection above
-                # Just set end_screen_shown flag and continue
-                print("Transition to end_screen - letting decay detection handle it")
-                end_screen_shown = True
-                next_state = None
-                continue
-                
-            # Clean up previous state
-            if current_state == "main_menu":
-                # Clean up menu resources if needed
-                pass
-            elif current_state in ["game1", "game2", "game3"]:
-                # Clean up current game resources
-                current_game = None
+            # Clean up current game resources
+            ctx.current_game = None
             
             # Initialize new state
-            if next_state == "main_menu":
-                # Prepare to go back to main menu
-                pygame.display.quit()
-                pygame.display.init()
-                screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.DOUBLEBUF | pygame.OPENGL)
-                menu = MainMenu(decay_engine, preloaded_objects)
-                
-            elif next_state == "game1":
-                # Switch to Game1
-                pygame.display.quit()
-                pygame.display.init()
-                screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-                current_game = Game1(decay_engine, SCREEN_WIDTH, SCREEN_HEIGHT)
-            elif next_state == "game2":
-                # Switch to Game2
-                pygame.display.quit()
-                pygame.display.init()
-                screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-                current_game = Game2(decay_engine, SCREEN_WIDTH, SCREEN_HEIGHT)
-            elif next_state == "game3":
-                # Switch to Game3
-                pygame.display.quit()
-                pygame.display.init()
-                screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-                current_game = Game3(decay_engine, SCREEN_WIDTH, SCREEN_HEIGHT)
-            else:
-                print(f"Unknown next state: {next_state} - ignoring")
-                next_state = None
+            enter_state = STATE_ENTRY.get(next_state)
+            if enter_state is None:
+                print(f"Unknown next state: {next_name} - ignoring")
+                ctx.next_state = None
                 continue
+            enter_state(ctx)
             
             # Complete the transition
             current_state = next_state
-            next_state = None
+            ctx.next_state = None
         
         # Handle current state
-        if current_state == "main_menu":
-            result = menu.run()
-            
-            # Handle the result from main menu
-            if result is None:
-                running = False
-            elif result == "end_screen":
-                # Special handling for end_screen - let decay detection handle it
-                decay_engine.decay_percentage = 0.0
-                end_screen_shown = False  # This will trigger the zero decay detection
-            elif isinstance(result, str):
-                next_state = result
-                
-        elif current_state in ["game1", "game2", "game3"]:
-            if current_game:
-                result = current_game.run()
-                
-                # Handle the result from games
-                if result is None:
-                    running = False
-                elif result == "end_screen":
-                    # Special handling for end_screen - let decay detection handle it
-                    decay_engine.decay_percentage = 0.0
-                    end_screen_shown = False  # This will trigger the zero decay detection
-                elif isinstance(result, str):
-                    next_state = result
-            else:
-                # If game object is missing, go back to menu
-                next_state = "main_menu"
-                
+        tick = STATE_TICK.get(current_state)
+        if tick is None:
+            print(f"Unknown state: {current_state.name.lower()}")
+            ctx.running = False
         else:
-            print(f"Unknown state: {current_state}")
-            running = False
+            tick(ctx)
             
-        # Keep the frame rate consistent
-        clock.tick(FPS)
+        # Keep the frame rate consistent - but not when a transition is
+        # pending, as the state's own loop has already paced its frames
+        if ctx.next_state is None:
+            clock.tick(FPS)
     
     # Clean up
     pygame.quit()
     sys.exit()
 
 if __name__ == "__main__":
+    # Needed for the preload worker processes in PyInstaller builds
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
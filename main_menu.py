@@ -7,21 +7,39 @@ import random
 import math
 import pygame
 import json
+from collections import OrderedDict
+from functools import lru_cache
 from pygame.locals import *
+
+# Skip PyOpenGL's glGetError check after every call - must be set before
+# OpenGL.GL is first imported (utils sets it too, for when it's imported first)
+import OpenGL
+OpenGL.ERROR_CHECKING = False
+OpenGL.ERROR_LOGGING = False
 from OpenGL.GL import *
 from OpenGL.GLU import *
 import numpy as np
 
-from utils.blender_loader import BlenderModel, create_default_cube, create_default_sphere
+from utils.blender_loader import load_model, create_default_cube, create_default_sphere
 from utils.decay_bar import DecayBar
 from utils.color_utils import load_jetbrains_mono_font
 from utils.asset_utils import get_asset_path
+from utils import menu_kernels
 
 # Constants
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 FPS = 60
 
+# Decay grid stage shown in object labels, by fifth of the decay level (lowest first)
+LABEL_STAGES = (5, 4, 3, 2, 1)
+
+# Spawns' random numbers are drawn in batches of this many spawns
+SPAWN_RANDOM_BATCH = 256
+
+# Most rendered text textures kept uploaded before the least recently used is deleted
+TEXT_TEXTURE_CACHE_SIZE = 256
+
 
 # Load the decay grids JSON
 json_path = get_asset_path('decay_grids.json')
@@ -32,10 +50,184 @@ except Exception as e:
     print(f"Error loading decay_grids.json: {e}")
     DECAY_GRIDS = None
 
+# Value of every two-digit hex byte, in any letter case
+_HEX_BYTE = {key: value
+             for value in range(256)
+             for digits in (f"{value:02x}",)
+             for key in (digits, digits.upper(), digits[0].upper() + digits[1], digits[0] + digits[1].upper())}
+
+# Specular material shared by every menu object
+MATERIAL_SPECULAR = np.array([0.8, 0.8, 0.8, 1.0], dtype=np.float32)
+
+def build_color_luts(decay_grids):
+    """
+    Parse every decay grid cell's color into lookup tables indexed by
+    (stage, row, column)
+    
+    Args:
+        decay_grids (dict): Parsed decay_grids.json
+        
+    Returns:
+        tuple: (hex, packed) arrays of shape (stages, rows, cols) - the "#rrggbb"
+               strings and 0xRRGGBB uint32 values - or (None, None) if the
+               grids are missing or not rectangular
+    """
+    if decay_grids is None:
+        return None, None
+    try:
+        hex_colors = np.array([stage["grid"] for stage in decay_grids["stages"]], dtype='U7')
+        packed = np.array([[[(_HEX_BYTE[hex_color[1:3]] << 16) | (_HEX_BYTE[hex_color[3:5]] << 8)
+                             | _HEX_BYTE[hex_color[5:7]] for hex_color in row] for row in stage]
+                           for stage in hex_colors.tolist()], dtype=np.uint32).reshape(hex_colors.shape)
+    except (KeyError, TypeError, ValueError) as e:
+        print(f"Error building decay grid colors: {e!r}")
+        return None, None
+    return hex_colors, packed
+
+HEX_LUT, RGB_LUT = build_color_luts(DECAY_GRIDS)
+
+def build_material_luts(packed):
+    """
+    Build diffuse and ambient material colors for every decay grid cell
+    
+    Args:
+        packed (np.ndarray): 0xRRGGBB colors by (stage, row, column), or None
+        
+    Returns:
+        tuple: (diffuse, ambient) float32 arrays of shape (stages, rows, cols, 4)
+               holding RGBA colors ready for glMaterialfv, or (None, None)
+               without colors
+    """
+    if packed is None:
+        return None, None
+    
+    diffuse = np.ones(packed.shape + (4,), dtype=np.float32)
+    diffuse[..., 0] = (packed >> 16) & 0xFF
+    diffuse[..., 1] = (packed >> 8) & 0xFF
+    diffuse[..., 2] = packed & 0xFF
+    diffuse[..., :3] /= 255.0
+    
+    ambient = diffuse.copy()
+    ambient[..., :3] *= 0.4
+    return diffuse, ambient
+
+DIFFUSE_LUT, AMBIENT_LUT = build_material_luts(RGB_LUT)
+
+@lru_cache(maxsize=512)
+def hex_to_saturated_rgb(hex_color):
+    """
+    Convert a decay grid hex color to RGB, made more saturated so it stands
+    out better with lighting (cached - the grids only hold a small palette)
+    
+    Args:
+        hex_color (str): Color in "#rrggbb" form
+        
+    Returns:
+        tuple: (r, g, b) in the 0.0-1.0 range
+    """
+    r = _HEX_BYTE[hex_color[1:3]] / 255.0
+    g = _HEX_BYTE[hex_color[3:5]] / 255.0
+    b = _HEX_BYTE[hex_color[5:7]] / 255.0
+    
+    # Push each channel away from the average
+    avg = (r + g + b) / 3
+    return (min(1.0, r + (r - avg) * 0.5),
+            min(1.0, g + (g - avg) * 0.5),
+            min(1.0, b + (b - avg) * 0.5))
+
+class MotionStore:
+    """
+    Positions, rotations and their speeds for a set of flying objects,
+    kept as rows of contiguous arrays so they can be stepped together
+    
+    Rows stay packed - removing one moves the last row into its place.
+    """
+    
+    FIELDS = ('positions', 'rotations', 'velocities', 'rotation_speeds')
+    
+    def __init__(self, capacity=256):
+        """
+        Initialize an empty store
+        
+        Args:
+            capacity (int): Number of objects to allocate space for up front
+        """
+        self.count = 0
+        for attr in self.FIELDS:
+            setattr(self, attr, np.zeros((capacity, 3), dtype=np.float32))
+    
+    def add(self, position, rotation, velocity, rotation_speed):
+        """
+        Add an object's motion
+        
+        Args:
+            position (tuple): (x, y, z) position
+            rotation (tuple): (x, y, z) rotation in degrees
+            velocity (tuple): (x, y, z) movement per frame at 60 FPS
+            rotation_speed (tuple): (x, y, z) rotation per frame at 60 FPS
+            
+        Returns:
+            int: Row index of the object
+        """
+        i = self.count
+        if i == len(self.positions):
+            # Double the arrays, keeping stored rows
+            for attr in self.FIELDS:
+                arr = getattr(self, attr)
+                grown = np.zeros((len(arr) * 2, 3), dtype=arr.dtype)
+                grown[:i] = arr
+                setattr(self, attr, grown)
+        
+        self.positions[i] = position
+        self.rotations[i] = rotation
+        self.velocities[i] = velocity
+        self.rotation_speeds[i] = rotation_speed
+        self.count = i + 1
+        return i
+    
+    def remove(self, i):
+        """
+        Remove a row by moving the last row into its place
+        
+        Args:
+            i (int): Row index to remove
+            
+        Returns:
+            int: Index the moved row came from (equal to i if it was the last)
+        """
+        last = self.count - 1
+        if i != last:
+            for attr in self.FIELDS:
+                arr = getattr(self, attr)
+                arr[i] = arr[last]
+        self.count = last
+        return last
+    
+    def clear(self):
+        """Remove all rows"""
+        self.count = 0
+    
+    def step(self, delta_time):
+        """
+        Move and rotate every object
+        
+        Args:
+            delta_time (float): Time in seconds since last update
+            
+        Returns:
+            np.ndarray: Indices of objects that have gone off the left of the screen
+        """
+        n = self.count
+        frames = delta_time * 60  # Scale by frame rate
+        self.positions[:n] += self.velocities[:n] * frames
+        self.rotations[:n] += self.rotation_speeds[:n] * frames
+        return np.flatnonzero(self.positions[:n, 0] < -8.0)
+
 class BlenderObject:
     """Represents a 3D object loaded from Blender"""
     
-    def __init__(self, obj_file, initial_position, initial_rotation, scale=1.0, row_index=None, preloaded_model=None):
+    def __init__(self, obj_file, initial_position, initial_rotation, scale=1.0, row_index=None, preloaded_model=None,
+                 motion=None):
         """
         Initialize a Blender object
         
@@ -46,6 +238,8 @@ class BlenderObject:
             scale (float): Scaling factor
             row_index (int, optional): The row index for color selection
             preloaded_model (BlenderModel, optional): Preloaded model to use instead of loading from file
+            motion (MotionStore, optional): Store to keep the object's motion in (a store
+                                            of its own is made if not given)
         """
         self.model = preloaded_model  # Use preloaded model if provided
         
@@ -72,7 +266,7 @@ class BlenderObject:
         # Try to load the model from file if not preloaded
         if self.model is None:
             if os.path.exists(obj_file):
-                self.model = BlenderModel(obj_file)
+                self.model = load_model(obj_file)
                 self.object_name = os.path.basename(obj_file)
             else:
                 # Create default shapes if file doesn't exist
@@ -89,13 +283,16 @@ class BlenderObject:
             # If we have a preloaded model, just use its name
             self.object_name = os.path.basename(obj_file)
             
-        self.position = list(initial_position)
-        self.rotation = list(initial_rotation)
         self.scale = scale
         
         # Movement parameters - always move from right to left
-        self.velocity = [-random.uniform(0.1, 0.2), 0, 0]  # Only horizontal movement
-        self.rotation_speed = [random.uniform(-1, 1) for _ in range(3)]
+        self.motion = motion if motion is not None else MotionStore(capacity=1)
+        self.index = self.motion.add(
+            initial_position,
+            initial_rotation,
+            (-random.uniform(0.1, 0.2), 0, 0),  # Only horizontal movement
+            [random.uniform(-1, 1) for _ in range(3)]
+        )
         
         # Base color assignment from decay grids
         if self.row_index is not None and DECAY_GRIDS is not None:
@@ -108,33 +305,22 @@ class BlenderObject:
                     col_index = self.grid_col
                     hex_color = stage_colors[self.row_index][col_index]
                     
-                    # Convert hex to RGB
-                    r = int(hex_color[1:3], 16) / 255.0
-                    g = int(hex_color[3:5], 16) / 255.0
-                    b = int(hex_color[5:7], 16) / 255.0
-                    
-                    # Make colors more saturated to stand out better with lighting
-                    # This uses a simple enhancement algorithm
-                    avg = (r + g + b) / 3
-                    r = min(1.0, r + (r - avg) * 0.5)
-                    g = min(1.0, g + (g - avg) * 0.5)
-                    b = min(1.0, b + (b - avg) * 0.5)
-                    
-                    self.base_color = [r, g, b]
+                    # Convert hex to RGB, made more saturated to stand out better with lighting
+                    self.base_color = hex_to_saturated_rgb(hex_color)
                     print(f"Assigned color {hex_color} -> {self.base_color} to {self.object_name}")
                 else:
                     # Use a pleasant default color instead of random
-                    self.base_color = [0.6, 0.8, 0.6]  # Soft green
+                    self.base_color = (0.6, 0.8, 0.6)  # Soft green
             except Exception as e:
                 print(f"Error assigning color: {e}")
                 # Use a pleasant default color instead of random
-                self.base_color = [0.6, 0.8, 0.6]  # Soft green
+                self.base_color = (0.6, 0.8, 0.6)  # Soft green
         else:
             # If no specific color assignment, use consistent pleasant colors
-            self.base_color = [0.6, 0.8, 0.6]  # Soft green
+            self.base_color = (0.6, 0.8, 0.6)  # Soft green
                 
         # Information about the object
-        self.info_text = f"Object: {self.object_name}\nPosition: {self.position}\nRotation: {self.rotation}\nColor: RGB{tuple(int(c*255) for c in self.base_color)}"
+        self.info_text = f"Object: {self.object_name}\nPosition: {self.position.tolist()}\nRotation: {self.rotation.tolist()}\nColor: RGB{tuple(int(c*255) for c in self.base_color)}"
         
         # Flag to mark if object has gone off screen
         self.off_screen = False
@@ -142,6 +328,39 @@ class BlenderObject:
         # Store screen position for label rendering
         self.screen_pos = None
     
+    # Motion lives in the store's arrays - these are views of this object's rows
+    @property
+    def position(self):
+        return self.motion.positions[self.index]
+    
+    @position.setter
+    def position(self, value):
+        self.motion.positions[self.index] = value
+    
+    @property
+    def rotation(self):
+        return self.motion.rotations[self.index]
+    
+    @rotation.setter
+    def rotation(self, value):
+        self.motion.rotations[self.index] = value
+    
+    @property
+    def velocity(self):
+        return self.motion.velocities[self.index]
+    
+    @velocity.setter
+    def velocity(self, value):
+        self.motion.velocities[self.index] = value
+    
+    @property
+    def rotation_speed(self):
+        return self.motion.rotation_speeds[self.index]
+    
+    @rotation_speed.setter
+    def rotation_speed(self, value):
+        self.motion.rotation_speeds[self.index] = value
+    
     def update(self, delta_time):
         """
         Update the object position and rotation
@@ -152,16 +371,14 @@ class BlenderObject:
         Returns:
             bool: False if object has gone off screen, True otherwise
         """
-        # Update position based on velocity
-        for i in range(3):
-            self.position[i] += self.velocity[i] * delta_time * 60  # Scale by frame rate
-            
-        # Update rotation based on rotation speed
-        for i in range(3):
-            self.rotation[i] += self.rotation_speed[i] * delta_time * 60  # Scale by frame rate
-            
+        # Update position and rotation from their speeds, in place in the store's rows
+        motion, i = self.motion, self.index
+        frames = delta_time * 60  # Scale by frame rate
+        motion.positions[i] += motion.velocities[i] * frames
+        motion.rotations[i] += motion.rotation_speeds[i] * frames
+        
         # Check if object has gone off screen (left side)
-        if self.position[0] < -8.0:  # Just off the left edge of the screen
+        if motion.positions[i, 0] < -8.0:  # Just off the left edge of the screen
             self.off_screen = True
             return False
             
@@ -181,47 +398,27 @@ class BlenderObject:
         decay_percentage = decay_engine.decay_percentage
         
         # Get color from appropriate stage based on current decay percentage
-        if self.row_index is not None and DECAY_GRIDS is not None:
-            try:
-                # Map decay percentage to stage index (0-5)
-                # Higher decay percentage = lower decay stage index
-                # 100% decay = stage 0, 0% decay = stage 5
-                stage_idx = min(5, int((100 - decay_percentage) / 20))
-                
-                # Get color from current decay stage for consistent theming
-                stage_colors = DECAY_GRIDS["stages"][stage_idx]["grid"]
-                if self.row_index < len(stage_colors) and self.grid_col < len(stage_colors[self.row_index]):
-                    hex_color = stage_colors[self.row_index][self.grid_col]
-                    
-                    # Convert hex to RGB (0.0-1.0 range)
-                    r = int(hex_color[1:3], 16) / 255.0
-                    g = int(hex_color[3:5], 16) / 255.0
-                    b = int(hex_color[5:7], 16) / 255.0
-                    
-                    # Use these exact colors instead of applying decay effect
-                    color = (r, g, b)
-                else:
-                    # Use base color as fallback
-                    color = tuple(self.base_color)
-            except Exception as e:
-                # Use base color if there's an error
-                color = tuple(self.base_color)
+        if (self.row_index is not None and DIFFUSE_LUT is not None
+                and self.row_index < DIFFUSE_LUT.shape[1] and self.grid_col < DIFFUSE_LUT.shape[2]):
+            # Map decay percentage to stage index (0-5)
+            # Higher decay percentage = lower decay stage index
+            # 100% decay = stage 0, 0% decay = stage 5
+            stage_idx = min(DIFFUSE_LUT.shape[0] - 1, int((100 - decay_percentage) / 20))
+            
+            # Use the exact grid colors instead of applying decay effect
+            diffuse = DIFFUSE_LUT[stage_idx, self.row_index, self.grid_col]
+            ambient = AMBIENT_LUT[stage_idx, self.row_index, self.grid_col]
+            color = diffuse[:3].tolist()
         else:
             # Use base color if no specific assignment
-            color = tuple(self.base_color)
-        
-        # Force GL_COLOR_MATERIAL to ensure colors are properly applied
-        glEnable(GL_COLOR_MATERIAL)
-        glColorMaterial(GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE)
+            color = self.base_color
+            ambient = [color[0] * 0.4, color[1] * 0.4, color[2] * 0.4, 1.0]
+            diffuse = [color[0], color[1], color[2], 1.0]
         
         # Set object material for better color fidelity
-        ambient = [color[0] * 0.4, color[1] * 0.4, color[2] * 0.4, 1.0]
-        diffuse = [color[0], color[1], color[2], 1.0]
-        specular = [0.8, 0.8, 0.8, 1.0]
-        
         glMaterialfv(GL_FRONT, GL_AMBIENT, ambient)
         glMaterialfv(GL_FRONT, GL_DIFFUSE, diffuse)
-        glMaterialfv(GL_FRONT, GL_SPECULAR, specular)
+        glMaterialfv(GL_FRONT, GL_SPECULAR, MATERIAL_SPECULAR)
         glMaterialf(GL_FRONT, GL_SHININESS, 50.0)
         
         # Add explicit color setting (redundant but ensures color is applied)
@@ -320,8 +517,20 @@ class MainMenu:
         glEnable(GL_COLOR_MATERIAL)
         glColorMaterial(GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE)
         
-        # Create Blender objects
+        # Create Blender objects - objects[i] keeps its motion in row i of the store
         self.objects = []
+        self.motion = MotionStore()
+        
+        # Compile the label projection now rather than on the first frame
+        menu_kernels.warm_up()
+        
+        # The OBJ files don't change while the game runs, so find them once
+        self._obj_files = self._discover_obj_files()
+        
+        # Random numbers for spawning, drawn a batch of spawns at a time
+        self._rng = np.random.default_rng()
+        self._spawn_randoms = None
+        self._spawn_random_index = SPAWN_RANDOM_BATCH
         
         # Setup Pygame surfaces for UI rendering
         self.pygame_screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), SRCALPHA)
@@ -332,6 +541,15 @@ class MainMenu:
         # Font for text
         self.font = load_jetbrains_mono_font(24)
         
+        # Uploaded text textures by (text, color), least recently used first
+        self._text_textures = OrderedDict()
+        
+        # Decay grid stage object labels show, and the labels by (row, column)
+        # for that stage - their textures are owned here, not by the text cache
+        self.current_decay_stage = None
+        self._labels = {}
+        self.update_decay_stage()
+        
         # Selected object for displaying information
         self.selected_object = None
         self.selection_time = 0
@@ -356,23 +574,16 @@ class MainMenu:
         # Save this instance for later
         MainMenu._instance = self
     
-    def spawn_new_object(self, position_override=None):
+    def _discover_obj_files(self):
         """
-        Spawn a new object from the right side of the screen
+        Find the OBJ files new objects are picked from
         
-        Args:
-            position_override (tuple, optional): Override for the initial position
-            
         Returns:
-            BlenderObject: The newly created object
+            list: (path, row index or None) for each OBJ file
         """
-        # Define path to OBJ files
+        # Define path to OBJ files, creating the directory if it doesn't exist
         obj_dir = get_asset_path("blender", "objects")
-        
-        # If directory doesn't exist, create it
-        if not os.path.exists(obj_dir):
-            os.makedirs(obj_dir)
-            print(f"Created directory: {obj_dir}")
+        os.makedirs(obj_dir, exist_ok=True)
         
         # Check for custom row objects first
         custom_row_objects = []
@@ -387,10 +598,8 @@ class MainMenu:
             print(f"Using {len(custom_row_objects)} custom row objects")
         else:
             # Get list of available OBJ files
-            obj_files = []
-            if os.path.exists(obj_dir):
-                obj_files = [(os.path.join(obj_dir, f), None) for f in os.listdir(obj_dir) 
-                        if f.endswith('.obj') and os.path.isfile(os.path.join(obj_dir, f))]
+            obj_files = [(os.path.join(obj_dir, f), None) for f in os.listdir(obj_dir)
+                         if f.endswith('.obj') and os.path.isfile(os.path.join(obj_dir, f))]
         
         # If no OBJ files found, use default shapes
         if not obj_files:
@@ -400,6 +609,34 @@ class MainMenu:
                 (os.path.join(obj_dir, "torus.obj"), None)
             ]
         
+        return obj_files
+    
+    def _next_spawn_randoms(self):
+        """
+        Get the next spawn's uniform random numbers in [0, 1)
+        
+        Returns:
+            list: 8 numbers - y, z, x/y/z rotation, scale, OBJ file pick and speed
+        """
+        if self._spawn_random_index == SPAWN_RANDOM_BATCH:
+            self._spawn_randoms = self._rng.random((SPAWN_RANDOM_BATCH, 8)).tolist()
+            self._spawn_random_index = 0
+        randoms = self._spawn_randoms[self._spawn_random_index]
+        self._spawn_random_index += 1
+        return randoms
+    
+    def spawn_new_object(self, position_override=None):
+        """
+        Spawn a new object from the right side of the screen
+        
+        Args:
+            position_override (tuple, optional): Override for the initial position
+            
+        Returns:
+            BlenderObject: The newly created object
+        """
+        y_rand, z_rand, rx_rand, ry_rand, rz_rand, scale_rand, pick_rand, speed_rand = self._next_spawn_randoms()
+        
         # Position new object - use override if provided, otherwise far off-screen to the right
         if position_override:
             x_pos, y_pos, z_pos = position_override
@@ -410,19 +647,19 @@ class MainMenu:
             
             # Random vertical position - Constrain to be more visible
             # Keep objects within a narrower visible band
-            y_pos = random.uniform(-2.5, 2.5)  # Narrower range for better visibility
+            y_pos = -2.5 + 5.0 * y_rand  # Narrower range for better visibility
             
             # Random depth - Keep closer to camera for better visibility
-            z_pos = random.uniform(-3, -1)  # Closer to camera
+            z_pos = -3.0 + 2.0 * z_rand  # Closer to camera
         
         # Random rotation
-        rotation = [random.uniform(0, 360) for _ in range(3)]
+        rotation = (360.0 * rx_rand, 360.0 * ry_rand, 360.0 * rz_rand)
         
         # Random scale - Less variation for more consistency
-        scale = random.uniform(0.8, 1.1)  # Narrower range for more consistent sizing
+        scale = 0.8 + 0.3 * scale_rand  # Narrower range for more consistent sizing
         
         # Select random OBJ file
-        obj_file, row_index = random.choice(obj_files)
+        obj_file, row_index = self._obj_files[int(pick_rand * len(self._obj_files))]
         obj_basename = os.path.basename(obj_file)
         
         # Use preloaded object if available
@@ -432,14 +669,29 @@ class MainMenu:
             print(f"Using preloaded model for {obj_basename}")
         
         # Create object
-        new_obj = BlenderObject(obj_file, (x_pos, y_pos, z_pos), rotation, scale, row_index, preloaded_model)
+        new_obj = BlenderObject(obj_file, (x_pos, y_pos, z_pos), rotation, scale, row_index, preloaded_model,
+                                self.motion)
         
         # Fixed velocity for smooth, consistent animation
-        new_obj.velocity = [-random.uniform(0.05, 0.1), 0, 0]  # Slower movement for more graceful entry
+        new_obj.velocity = (-(0.05 + 0.05 * speed_rand), 0, 0)  # Slower movement for more graceful entry
         
         self.objects.append(new_obj)
         return new_obj
     
+    def update_decay_stage(self):
+        """Work out this frame's decay grid stage for object labels from the decay level"""
+        decay_level = self.decay_engine.decay_percentage / 100.0
+        decay_stage = LABEL_STAGES[min(4, max(0, int(decay_level * 5)))]
+        if decay_stage != self.current_decay_stage:
+            self.current_decay_stage = decay_stage
+            
+            # Labels show the stage, so delete the old stage's label textures
+            label_textures = [texture for textures, _, _ in self._labels.values()
+                              for texture, _, _ in textures]
+            if label_textures:
+                glDeleteTextures(len(label_textures), label_textures)
+            self._labels.clear()
+    
     def update_objects(self, delta_time):
         """
         Update all objects and manage object lifecycle
@@ -447,20 +699,26 @@ class MainMenu:
         Args:
             delta_time (float): Time in seconds since last update
         """
-        # Update existing objects and track which ones went off-screen
-        objects_to_remove = []
-        for obj in self.objects:
-            if not obj.update(delta_time):
-                objects_to_remove.append(obj)
-        
-        # Remove off-screen objects
-        for obj in objects_to_remove:
-            if obj in self.objects:
-                self.objects.remove(obj)
-                
-                # If the removed object was selected, clear selection
-                if obj == self.selected_object:
-                    self.selected_object = None
+        # All labels show the same decay stage, so work it out once per frame
+        self.update_decay_stage()
+        
+        # Move all objects at once and find the ones that went off-screen
+        off_screen = self.motion.step(delta_time)
+        
+        # Remove off-screen objects, highest index first so the rows moved
+        # into their places have already been checked
+        for i in off_screen[::-1].tolist():
+            obj = self.objects[i]
+            obj.off_screen = True
+            moved_from = self.motion.remove(i)
+            moved = self.objects.pop()
+            if moved_from != i:
+                moved.index = i
+                self.objects[i] = moved
+        
+        # If a removed object was selected, clear selection
+        if self.selected_object is not None and self.selected_object.off_screen:
+            self.selected_object = None
         
         # Spawn new objects with a certain probability
         if random.random() < 0.02:  # 2% chance each frame
@@ -470,9 +728,59 @@ class MainMenu:
         if not self.objects:
             self.spawn_new_object()
     
+    def _get_text_texture(self, text, color=(255, 255, 255)):
+        """
+        Get an OpenGL texture of rendered text, uploading it on first use
+        
+        Args:
+            text (str): Text to render
+            color (tuple): RGB color tuple for the text
+            
+        Returns:
+            tuple: (texture id, width, height)
+        """
+        key = (text, color)
+        entry = self._text_textures.get(key)
+        if entry is not None:
+            self._text_textures.move_to_end(key)
+            return entry
+        
+        entry = self._upload_text_texture(text, color)
+        self._text_textures[key] = entry
+        
+        # Delete the least recently used texture once the cache is full
+        if len(self._text_textures) > TEXT_TEXTURE_CACHE_SIZE:
+            _, (old_texture, _, _) = self._text_textures.popitem(last=False)
+            glDeleteTextures(1, [old_texture])
+        
+        return entry
+    
+    def _upload_text_texture(self, text, color=(255, 255, 255)):
+        """
+        Render text and upload it as a new OpenGL texture
+        
+        Args:
+            text (str): Text to render
+            color (tuple): RGB color tuple for the text
+            
+        Returns:
+            tuple: (texture id, width, height) - the caller deletes the texture
+        """
+        # Create a texture from the text surface
+        text_surface = self.font.render(text, True, color)
+        text_width, text_height = text_surface.get_size()
+        text_data = pygame.image.tostring(text_surface, "RGBA", True)
+        text_texture = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, text_texture)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, text_width, text_height, 0, GL_RGBA, GL_UNSIGNED_BYTE, text_data)
+        return text_texture, text_width, text_height
+    
     def draw_text_with_background(self, text, position, color=(255, 255, 255), bg_color=(0, 0, 0, 128)):
         """
-        Draw text with a background directly to the screen
+        Draw text with a background directly to the screen (expects the 2D
+        drawing state set up by render_2d_overlay)
         
         Args:
             text (str): Text to display
@@ -483,29 +791,8 @@ class MainMenu:
         # Move cursor to position
         x, y = position
         
-        # Create temporary Pygame surface for the text
-        text_surface = self.font.render(text, True, color)
-        text_width, text_height = text_surface.get_size()
-        
-        # Save current OpenGL state
-        glPushAttrib(GL_ALL_ATTRIB_BITS)
-        
-        # Disable depth testing so text is always on top
-        glDisable(GL_DEPTH_TEST)
-        
-        # Enable blending for transparency
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        
-        # Switch to 2D orthographic projection
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        glOrtho(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT, -1, 1)
-        
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
-        glLoadIdentity()
+        # Get the text's texture, uploaded the first time it's drawn
+        text_texture, text_width, text_height = self._get_text_texture(text, color)
         
         # Convert y-coordinate from top-left to bottom-left origin
         y = SCREEN_HEIGHT - y - text_height
@@ -519,14 +806,6 @@ class MainMenu:
         glVertex2f(x - 5, y + text_height + 5)
         glEnd()
         
-        # Create a texture from the text surface
-        text_data = pygame.image.tostring(text_surface, "RGBA", True)
-        text_texture = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, text_texture)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, text_width, text_height, 0, GL_RGBA, GL_UNSIGNED_BYTE, text_data)
-        
         # Draw textured quad
         glEnable(GL_TEXTURE_2D)
         glBindTexture(GL_TEXTURE_2D, text_texture)
@@ -537,19 +816,13 @@ class MainMenu:
         glTexCoord2f(1, 1); glVertex2f(x + text_width, y + text_height)
         glTexCoord2f(0, 1); glVertex2f(x, y + text_height)
         glEnd()
-        
-        # Clean up texture
-        glDeleteTextures(1, [text_texture])
-        
-        # Restore previous OpenGL state
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
-        glPopMatrix()
-        glPopAttrib()
+        glDisable(GL_TEXTURE_2D)
     
     def render_decay_bar(self):
-        """Render decay bar at the bottom of the screen using OpenGL directly"""
+        """
+        Render decay bar at the bottom of the screen using OpenGL directly
+        (expects the 2D drawing state set up by render_2d_overlay)
+        """
         # Get the decay percentage from the engine
         percentage = self.decay_engine.decay_percentage
         
@@ -557,24 +830,6 @@ class MainMenu:
         bar_y = self.decay_bar.rect.y
         bar_height = self.decay_bar.rect.height
         
-        # Save the current lighting state
-        glPushAttrib(GL_ALL_ATTRIB_BITS)
-        
-        # Disable lighting and depth testing for 2D UI
-        glDisable(GL_LIGHTING)
-        glDisable(GL_LIGHT0)
-        glDisable(GL_DEPTH_TEST)
-        
-        # Switch to orthographic projection for 2D drawing
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        glOrtho(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT, -1, 1)
-        
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
-        glLoadIdentity()
-        
         # Convert bar_y from top-left to bottom-left origin
         bar_y = SCREEN_HEIGHT - bar_y - bar_height
         
@@ -618,16 +873,7 @@ class MainMenu:
         
         # Draw percentage text
         text = f"{int(percentage)}%"
-        text_surface = self.font.render(text, True, (255, 255, 255))
-        text_width, text_height = text_surface.get_size()
-        
-        # Create texture
-        text_data = pygame.image.tostring(text_surface, "RGBA", True)
-        text_texture = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, text_texture)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, text_width, text_height, 0, GL_RGBA, GL_UNSIGNED_BYTE, text_data)
+        text_texture, text_width, text_height = self._get_text_texture(text)
         
         # Position text on the right side of the bar (to match the games)
         glEnable(GL_TEXTURE_2D)
@@ -645,15 +891,7 @@ class MainMenu:
         glTexCoord2f(0, 1); glVertex2f(text_x, text_y + text_height)
         glEnd()
         
-        # Clean up
-        glDeleteTextures(1, [text_texture])
         glDisable(GL_TEXTURE_2D)
-        
-        # Restore OpenGL state
-        glPopMatrix()
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glPopAttrib()  # This will restore the lighting state
 
     def render_3d(self):
         """Render the 3D scene with Blender objects"""
@@ -663,35 +901,25 @@ class MainMenu:
         # Set background color to black
         glClearColor(0.0, 0.0, 0.0, 1.0)
         
-        # Render all objects and update their screen positions
-        for obj in self.objects:
-            obj.render(self.decay_engine)
-            
-            # Fixed position calculation
-            x, y, z = obj.position
-            
-            # Only update screen position for objects in view
-            if z > -15 and abs(x) < 10 and abs(y) < 10:
-                # Basic perspective projection
-                scale_x = 50
-                scale_y = 50
-                center_x = SCREEN_WIDTH // 2
-                center_y = SCREEN_HEIGHT // 2
-                
-                # Perspective factor (objects further away appear smaller)
-                perspective_factor = 15.0 / max(0.1, 15.0 + z)
-                
-                # Calculate screen coordinates
-                screen_x = center_x + int(x * scale_x * perspective_factor)
-                screen_y = center_y - int(y * scale_y * perspective_factor)
-                
-                # Store the screen position
-                obj.screen_pos = (screen_x, screen_y)
-            else:
-                obj.screen_pos = None
+        # Project every object to the screen at once with a basic perspective
+        # projection, only giving screen positions to objects in view
+        n = self.motion.count
+        screen = np.empty((n, 2), dtype=np.int32)
+        visible = np.empty(n, dtype=np.bool_)
+        menu_kernels.project_to_screen(self.motion.positions, n, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
+                                       50.0, screen, visible)
+        
+        # Render all objects and store their screen positions in one pass
+        decay_engine = self.decay_engine
+        for obj, screen_pos, in_view in zip(self.objects, screen.tolist(), visible.tolist()):
+            obj.render(decay_engine)
+            obj.screen_pos = tuple(screen_pos) if in_view else None
 
     def draw_object_label_with_line(self, obj):
-        """Draw a technical-style label directly attached to object with white dashed connecting line"""
+        """
+        Draw a technical-style label directly attached to object with white dashed
+        connecting line (expects the 2D drawing state set up by render_2d_overlay)
+        """
         try:
             if not hasattr(obj, 'screen_pos') or obj.screen_pos is None:
                 return
@@ -702,39 +930,38 @@ class MainMenu:
             # If row_index is available, use it (it's 0-based)
             row_index = obj.row_index if hasattr(obj, 'row_index') and obj.row_index is not None else 0
             
-            # Get color from decay grid based on current decay stage
-            decay_level = self.decay_engine.decay_percentage / 100.0
-            if decay_level < 0.2:
-                decay_stage = 5
-            elif decay_level < 0.4:
-                decay_stage = 4
-            elif decay_level < 0.6:
-                decay_stage = 3
-            elif decay_level < 0.8:
-                decay_stage = 2
-            else:
-                decay_stage = 1
-            
             # Choose a random column if not already assigned
             if not hasattr(obj, 'grid_col'):
                 obj.grid_col = random.randint(0, 12)  # 13 columns (0-12)
+            
+            # Labels only change with the decay stage, so reuse them until it does
+            label_key = (row_index, obj.grid_col)
+            label = self._labels.get(label_key)
+            if label is None:
+                # Get color from decay grid based on current decay stage
+                decay_stage = self.current_decay_stage
                 
-            # Ensure DECAY_GRIDS is available
-            if DECAY_GRIDS is not None:
-                # Get hex color from the grid
-                try:
-                    hex_color = DECAY_GRIDS["stages"][decay_stage]["grid"][row_index][obj.grid_col]
-                except (KeyError, IndexError):
+                # Get hex color from the grid, if it's available and has this cell
+                if (HEX_LUT is not None and decay_stage < HEX_LUT.shape[0]
+                        and row_index < HEX_LUT.shape[1] and obj.grid_col < HEX_LUT.shape[2]):
+                    hex_color = HEX_LUT[decay_stage, row_index, obj.grid_col]
+                else:
                     hex_color = '#FFFFFF'  # Fallback color if not found
-            else:
-                hex_color = '#FFFFFF'  # Default if decay grids not available
-            
-            # Generate label text with correct information
-            label_text = [
-                f"Row:{row_index+1} Col:{obj.grid_col+1}",
-                f"Color:{hex_color}",
-                f"DecayStage:{decay_stage+1}"
-            ]
+                
+                # Generate label text with correct information
+                label_text = [
+                    f"Row:{row_index+1} Col:{obj.grid_col+1}",
+                    f"Color:{hex_color}",
+                    f"DecayStage:{decay_stage+1}"
+                ]
+                
+                # Upload each line, always white
+                rendered_lines = [self._upload_text_texture(line) for line in label_text]
+                label = (rendered_lines,
+                         max(text_width for _, text_width, _ in rendered_lines),
+                         sum(line_height for _, _, line_height in rendered_lines))
+                self._labels[label_key] = label
+            rendered_lines, max_text_width, text_height = label
             
             # Position the label at a consistent offset from the object
             # Use object's stored offset or initialize new one
@@ -756,44 +983,12 @@ class MainMenu:
             label_x = screen_x + obj.label_offset[0]
             label_y = screen_y + obj.label_offset[1]
             
-            # OpenGL setup for 2D drawing
-            glPushAttrib(GL_ALL_ATTRIB_BITS)
-            glDisable(GL_DEPTH_TEST)
-            glDisable(GL_LIGHTING)  # Disable lighting for UI elements
-            glMatrixMode(GL_PROJECTION)
-            glPushMatrix()
-            glLoadIdentity()
-            glOrtho(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT, -1, 1)
-            glMatrixMode(GL_MODELVIEW)
-            glPushMatrix()
-            glLoadIdentity()
-            
             # Convert from top-left to bottom-left coordinates
             screen_y = SCREEN_HEIGHT - screen_y
             label_y = SCREEN_HEIGHT - label_y
             
-            # Draw each line of text
-            text_height = 0
-            max_text_width = 0
-            rendered_lines = []
-            
-            for line in label_text:
-                text_surface = self.font.render(line, True, (255, 255, 255))  # Always white
-                text_width, line_height = text_surface.get_size()
-                max_text_width = max(max_text_width, text_width)
-                text_height += line_height
-                rendered_lines.append((text_surface, text_width, line_height))
-            
             # Draw text lines directly without background
-            for i, (text_surface, text_width, line_height) in enumerate(rendered_lines):
-                # Create texture from text
-                text_data = pygame.image.tostring(text_surface, "RGBA", True)
-                text_texture = glGenTextures(1)
-                glBindTexture(GL_TEXTURE_2D, text_texture)
-                glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-                glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-                glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, text_width, line_height, 0, GL_RGBA, GL_UNSIGNED_BYTE, text_data)
-                
+            for i, (text_texture, text_width, line_height) in enumerate(rendered_lines):
                 # Position for this line (accounting for bottom-left origin)
                 line_y = label_y - i * line_height
                 
@@ -808,9 +1003,6 @@ class MainMenu:
                 glTexCoord2f(1, 1); glVertex2f(label_x + text_width, line_y)
                 glTexCoord2f(0, 1); glVertex2f(label_x, line_y)
                 glEnd()
-                
-                # Clean up
-                glDeleteTextures(1, [text_texture])
             
             # Draw connecting line as a dashed line
             glDisable(GL_TEXTURE_2D)
@@ -870,36 +1062,58 @@ class MainMenu:
                     # Move to next segment
                     current_distance = end_distance
                     drawing = not drawing
-            
-            # Restore OpenGL state
-            glPopMatrix()
-            glMatrixMode(GL_PROJECTION)
-            glPopMatrix()
-            glPopAttrib()
         except Exception as e:
             print(f"Error in draw_object_label: {e}")
 
     def render_2d_overlay(self):
         """Render 2D overlay with text and UI"""
-        # Draw object labels
-        for obj in self.objects:
-            if hasattr(obj, 'screen_pos') and obj.screen_pos is not None:
-                # Only label objects that are in front
-                if obj.position[2] > -5:
-                    self.draw_object_label_with_line(obj)
-        
-        # Draw instruction text at the bottom of the screen
-        instruction_text = "Click anywhere to enter a random game"
-        text_surface = self.font.render(instruction_text, True, (255, 255, 255))
-        text_width = text_surface.get_size()[0]
-        
-        self.draw_text_with_background(
-            instruction_text, 
-            (SCREEN_WIDTH // 2 - text_width // 2, SCREEN_HEIGHT - 80)
-        )
+        # Set up 2D drawing once for the whole overlay, saving only the state
+        # groups it changes: enables, blend function, current color, line
+        # width and texture binding
+        glPushAttrib(GL_ENABLE_BIT | GL_COLOR_BUFFER_BIT | GL_CURRENT_BIT | GL_LINE_BIT | GL_TEXTURE_BIT)
+        
+        # Disable lighting and depth testing for 2D UI, blending for transparency
+        glDisable(GL_LIGHTING)
+        glDisable(GL_DEPTH_TEST)
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        
+        # Switch to 2D orthographic projection
+        glMatrixMode(GL_PROJECTION)
+        glPushMatrix()
+        glLoadIdentity()
+        glOrtho(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT, -1, 1)
         
-        # Draw decay bar at the bottom of the screen
-        self.render_decay_bar()
+        glMatrixMode(GL_MODELVIEW)
+        glPushMatrix()
+        glLoadIdentity()
+        
+        try:
+            # Draw object labels
+            for obj in self.objects:
+                if hasattr(obj, 'screen_pos') and obj.screen_pos is not None:
+                    # Only label objects that are in front
+                    if obj.position[2] > -5:
+                        self.draw_object_label_with_line(obj)
+            
+            # Draw instruction text at the bottom of the screen
+            instruction_text = "Click anywhere to enter a random game"
+            text_width = self.font.size(instruction_text)[0]
+            
+            self.draw_text_with_background(
+                instruction_text, 
+                (SCREEN_WIDTH // 2 - text_width // 2, SCREEN_HEIGHT - 80)
+            )
+            
+            # Draw decay bar at the bottom of the screen
+            self.render_decay_bar()
+        finally:
+            # Restore OpenGL state
+            glMatrixMode(GL_PROJECTION)
+            glPopMatrix()
+            glMatrixMode(GL_MODELVIEW)
+            glPopMatrix()
+            glPopAttrib()
 
 
     def save_state(self):
@@ -908,10 +1122,10 @@ class MainMenu:
         for obj in self.objects:
             # Save essential properties for each object
             obj_state = {
-                'position': obj.position.copy() if isinstance(obj.position, list) else list(obj.position),
-                'rotation': obj.rotation.copy() if isinstance(obj.rotation, list) else list(obj.rotation),
-                'velocity': obj.velocity.copy() if isinstance(obj.velocity, list) else list(obj.velocity),
-                'rotation_speed': obj.rotation_speed.copy() if isinstance(obj.rotation_speed, list) else list(obj.rotation_speed),
+                'position': obj.position.tolist(),
+                'rotation': obj.rotation.tolist(),
+                'velocity': obj.velocity.tolist(),
+                'rotation_speed': obj.rotation_speed.tolist(),
                 'scale': obj.scale,
                 'object_name': obj.object_name,
                 'row_index': obj.row_index,
@@ -928,6 +1142,8 @@ class MainMenu:
         """Restore objects from a previously saved state"""
         self.objects = []
         
+        self.motion.clear()
+        
         # Get path to OBJ files
         obj_dir = os.path.join("assets", "blender", "objects")
         
@@ -965,7 +1181,8 @@ class MainMenu:
                 obj_state['rotation'], 
                 obj_state['scale'], 
                 obj_state['row_index'] if 'row_index' in obj_state else None,
-                preloaded_model
+                preloaded_model,
+                self.motion
             )
             
             # Restore other properties
@@ -976,7 +1193,7 @@ class MainMenu:
             if 'grid_col' in obj_state:
                 new_obj.grid_col = obj_state['grid_col']
             if 'base_color' in obj_state:
-                new_obj.base_color = obj_state['base_color']
+                new_obj.base_color = tuple(obj_state['base_color'])
                 
             self.objects.append(new_obj)
             
@@ -1,6 +1,12 @@
 """
 Updated utils/__init__.py - Fixed import issues
 """
+# Skip PyOpenGL's glGetError check after every call - must be set before
+# OpenGL.GL is first imported, which blender_loader below does
+import OpenGL
+OpenGL.ERROR_CHECKING = False
+OpenGL.ERROR_LOGGING = False
+
 # Import the centralized asset function first
 from .asset_utils import get_asset_path
 
@@ -2,11 +2,71 @@
 blender_loader.py - Utilities for loading Blender objects and animations with MTL support
 """
 import os
+import json
 import pygame
 import math
+import numpy as np
 from OpenGL.GL import *
 from OpenGL.GLU import *
 
+def load_model_arrays(obj_file_path):
+    """
+    Load an OBJ file as the arrays of BlenderModel.to_arrays, from the
+    binary cache next to it when that is newer than the OBJ and MTL files
+    
+    Makes no OpenGL calls, so it can run in a worker process.
+    
+    Args:
+        obj_file_path (str): Path to OBJ file
+        
+    Returns:
+        dict: Array per name, for BlenderModel.from_arrays
+    """
+    cache_path = obj_file_path + ".cache.npz"
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(obj_file_path):
+            with np.load(cache_path) as cached:
+                arrays = dict(cached)
+            mtl_file = str(arrays['mtl_file'])
+            if not mtl_file or os.path.getmtime(cache_path) >= os.path.getmtime(mtl_file):
+                return arrays
+    except (OSError, ValueError, KeyError):
+        pass  # No usable cache - parse the OBJ file
+    
+    model = BlenderModel()
+    parsed = model.load_obj(obj_file_path)
+    arrays = model.to_arrays()
+    if parsed:
+        try:
+            np.savez(cache_path, **arrays)
+        except (OSError, ValueError) as e:
+            print(f"Could not cache {obj_file_path}: {e}")
+    return arrays
+
+# Models already loaded, keyed by (absolute path, modification time)
+_MODEL_CACHE = {}
+
+def load_model(obj_file_path, arrays=None):
+    """
+    Load an OBJ model once per version of the file, sharing the model
+    between everything that asks for it
+    
+    Args:
+        obj_file_path (str): Path to OBJ file
+        arrays (dict, optional): The file's arrays from load_model_arrays,
+            if already loaded (e.g. by a worker process)
+        
+    Returns:
+        BlenderModel: The loaded model
+    """
+    key = (os.path.abspath(obj_file_path), os.path.getmtime(obj_file_path))
+    model = _MODEL_CACHE.get(key)
+    if model is None:
+        if arrays is None:
+            arrays = load_model_arrays(obj_file_path)
+        model = _MODEL_CACHE[key] = BlenderModel.from_arrays(arrays)
+    return model
+
 class BlenderModel:
     """Class for loading and rendering Blender 3D models (OBJ format)"""
     
@@ -22,10 +82,76 @@ class BlenderModel:
         self.faces = []
         self.textures = []
         self.materials = {}
+        self.mtl_file = None
+        
+        # Triangulated vertex arrays for render_with_lighting, built on first use
+        self._draw_arrays = None
         
         if obj_file_path and os.path.exists(obj_file_path):
             self.load_obj(obj_file_path)
     
+    @classmethod
+    def load_cached(cls, obj_file_path):
+        """
+        Load an OBJ file through a binary cache saved next to it, so the
+        text is only parsed again when the OBJ or its MTL file changes
+        
+        Args:
+            obj_file_path (str): Path to OBJ file
+            
+        Returns:
+            BlenderModel: The loaded model
+        """
+        return cls.from_arrays(load_model_arrays(obj_file_path))
+    
+    def to_arrays(self):
+        """
+        Flatten the parsed model into arrays for np.savez
+        
+        Returns:
+            dict: Array per name, restored by from_arrays
+        """
+        material_names = sorted({material for _, material in self.faces if material is not None})
+        material_index = {name: i for i, name in enumerate(material_names)}
+        return {
+            'vertices': np.array(self.vertices, dtype=np.float64).reshape(-1, 3),
+            'normals': np.array(self.vertex_normals, dtype=np.float64).reshape(-1, 3),
+            'face_indices': np.array([idx for face, _ in self.faces for idx in face], dtype=np.int64),
+            'face_sizes': np.array([len(face) for face, _ in self.faces], dtype=np.int64),
+            'face_materials': np.array([material_index.get(material, -1) for _, material in self.faces], dtype=np.int64),
+            'material_names': np.array(material_names, dtype=str),
+            'materials': np.array(json.dumps(self.materials)),
+            'mtl_file': np.array(self.mtl_file or '')
+        }
+    
+    @classmethod
+    def from_arrays(cls, arrays):
+        """
+        Rebuild a model from arrays produced by to_arrays
+        
+        Args:
+            arrays (Mapping): Arrays by name, e.g. an np.load result
+            
+        Returns:
+            BlenderModel: The restored model
+        """
+        model = cls()
+        model.vertices = arrays['vertices'].tolist()
+        model.vertex_normals = arrays['normals'].tolist()
+        
+        indices = arrays['face_indices'].tolist()
+        material_names = arrays['material_names'].tolist()
+        faces = []
+        start = 0
+        for size, material in zip(arrays['face_sizes'].tolist(), arrays['face_materials'].tolist()):
+            faces.append((indices[start:start + size], material_names[material] if material >= 0 else None))
+            start += size
+        model.faces = faces
+        
+        model.materials = json.loads(str(arrays['materials']))
+        model.mtl_file = str(arrays['mtl_file']) or None
+        return model
+    
     def load_obj(self, file_path):
         """
         Load a Wavefront OBJ file
@@ -87,6 +213,8 @@ class BlenderModel:
             self.vertex_normals = normals
             self.faces = faces
             self.materials = materials
+            self.mtl_file = mtl_file if mtl_file and os.path.exists(mtl_file) else None
+            self._draw_arrays = None
             
             print(f"Loaded OBJ file: {file_path} ({len(vertices)} vertices, {len(faces)} faces)")
             return True
@@ -259,6 +387,75 @@ class BlenderModel:
         
         glPopMatrix()
 
+    def get_draw_arrays(self):
+        """
+        Get the model as triangles ready for glDrawArrays, grouped by material
+        (built the first time it's needed)
+        
+        Returns:
+            tuple or None: (vertices, normals, groups) where vertices and normals
+                           are float32 (N, 3) arrays and groups is a list of
+                           (first, count, specular, shininess) - None if the
+                           model has no faces to draw
+        """
+        if self._draw_arrays is not None:
+            return self._draw_arrays or None
+        
+        num_vertices = len(self.vertices)
+        
+        # Fan-triangulate each face, collecting vertex indices per material
+        indices_by_material = {}
+        for face_info in self.faces:
+            # Extract face and material
+            if isinstance(face_info, tuple) and len(face_info) == 2:
+                face, material_name = face_info
+            else:
+                # Handle older format where faces were stored directly
+                face, material_name = face_info, None
+            
+            # Skip invalid faces and vertex indices
+            if not isinstance(face, list) or len(face) < 3:
+                continue
+            face = [idx for idx in face if isinstance(idx, int) and 0 <= idx < num_vertices]
+            if len(face) < 3:
+                continue
+            
+            triangles = indices_by_material.setdefault(material_name, [])
+            for i in range(1, len(face) - 1):
+                triangles.extend((face[0], face[i], face[i + 1]))
+        
+        if not indices_by_material:
+            self._draw_arrays = ()
+            return None
+        
+        # Vertices without a normal get one pointing up
+        vertices = np.asarray(self.vertices, dtype=np.float32).reshape(-1, 3)
+        normals = np.tile(np.array([0.0, 1.0, 0.0], dtype=np.float32), (num_vertices, 1))
+        if len(self.vertex_normals):
+            known = np.asarray(self.vertex_normals, dtype=np.float32).reshape(-1, 3)[:num_vertices]
+            normals[:len(known)] = known
+        
+        groups = []
+        first = 0
+        for material_name, triangles in indices_by_material.items():
+            material = self.materials.get(material_name)
+            if material is not None:
+                # Just use the specular from the material, clamp shininess to valid range (0-128)
+                specular = list(material.get('specular', [1.0, 1.0, 1.0])) + [1.0]
+                shininess = max(0.0, min(128.0, material.get('shininess', 50.0)))
+            else:
+                specular = [1.0, 1.0, 1.0, 1.0]
+                shininess = 50.0
+            groups.append((first, len(triangles), specular, shininess))
+            first += len(triangles)
+        
+        order = np.fromiter((idx for triangles in indices_by_material.values() for idx in triangles),
+                            dtype=np.int64, count=first)
+        self._draw_arrays = (np.ascontiguousarray(vertices[order]),
+                             np.ascontiguousarray(normals[order]),
+                             groups)
+        return self._draw_arrays
+    
     def render_with_lighting(self, position=(0, 0, 0), rotation=(0, 0, 0), scale=1.0, color=(1.0, 1.0, 1.0)):
         """
         Render the model with lighting for glossy appearance
@@ -292,74 +489,26 @@ class BlenderModel:
             )
             
             # Skip rendering if model has no data
-            if not self.faces or not self.vertices:
+            draw_arrays = self.get_draw_arrays()
+            if draw_arrays is None:
                 glPopMatrix()
                 return
-            
-            # Draw each face with the applied color
-            for face_info in self.faces:
-                # Extract face and material
-                if isinstance(face_info, tuple) and len(face_info) == 2:
-                    face, material_name = face_info
-                else:
-                    # Handle older format where faces were stored directly
-                    face = face_info
-                    material_name = None
-                
-                # Skip invalid faces
-                if not isinstance(face, list) or len(face) < 3:
-                    continue
-                
-                # If we have material information, use it to modify our color
-                if hasattr(self, 'materials') and material_name in self.materials:
-                    material = self.materials[material_name]
-                    # Just use the specular from the material, clamp shininess to valid range
-                    specular = material.get('specular', [1.0, 1.0, 1.0])
-                    shininess = material.get('shininess', 50.0)
-                    
-                    # Limit shininess to valid range (0-128)
-                    shininess = max(0.0, min(128.0, shininess))
-                    
-                    try:
-                        # Apply material properties
-                        glMaterialfv(GL_FRONT, GL_SPECULAR, specular + [1.0])
-                        glMaterialf(GL_FRONT, GL_SHININESS, shininess)
-                    except Exception as e:
-                        print(f"Material property error (non-fatal): {e}")
-                        # Default material properties as fallback
-                        glMaterialfv(GL_FRONT, GL_SPECULAR, [1.0, 1.0, 1.0, 1.0])
-                        glMaterialf(GL_FRONT, GL_SHININESS, 50.0)
-                else:
-                    # Default material properties
-                    glMaterialfv(GL_FRONT, GL_SPECULAR, [1.0, 1.0, 1.0, 1.0])
-                    glMaterialf(GL_FRONT, GL_SHININESS, 50.0)
-                
-                # This is the key change - explicitly set the color for each face
-                # This ensures our color is applied regardless of material settings
-                glColor3f(color[0], color[1], color[2])
-                
-                # Draw the face as a triangle fan with the color applied
-                glBegin(GL_TRIANGLE_FAN)
-                for idx in face:
-                    if isinstance(idx, int) and 0 <= idx < len(self.vertices):
-                        # Set normal if available
-                        if hasattr(self, 'vertex_normals') and len(self.vertex_normals) > idx:
-                            try:
-                                normal = self.vertex_normals[idx]
-                                if len(normal) >= 3:
-                                    glNormal3fv(normal)
-                            except Exception:
-                                # If there's an error with normals, use generic normal
-                                glNormal3f(0.0, 1.0, 0.0)
-                        else:
-                            # Default normal pointing up
-                            glNormal3f(0.0, 1.0, 0.0)
-                        
-                        # Set vertex
-                        vertex = self.vertices[idx]
-                        if len(vertex) >= 3:
-                            glVertex3fv(vertex)
-                glEnd()
+            vertices, normals, groups = draw_arrays
+            
+            # Explicitly set the color so it's applied regardless of material settings
+            glColor3f(color[0], color[1], color[2])
+            
+            # Draw the triangles straight from the arrays, one call per material
+            glEnableClientState(GL_VERTEX_ARRAY)
+            glEnableClientState(GL_NORMAL_ARRAY)
+            glVertexPointer(3, GL_FLOAT, 0, vertices)
+            glNormalPointer(GL_FLOAT, 0, normals)
+            for first, count, specular, shininess in groups:
+                glMaterialfv(GL_FRONT, GL_SPECULAR, specular)
+                glMaterialf(GL_FRONT, GL_SHININESS, shininess)
+                glDrawArrays(GL_TRIANGLES, first, count)
+            glDisableClientState(GL_NORMAL_ARRAY)
+            glDisableClientState(GL_VERTEX_ARRAY)
             
             # Restore state
             glPopMatrix()
@@ -372,6 +521,73 @@ class BlenderModel:
             except:
                 pass  # Matrix wasn't pushed, or already popped
 
+class ModelStore:
+    """
+    Preloaded models by filename, with their metadata (vertex and face
+    counts, bounding boxes) kept in contiguous arrays for scanning
+    
+    Supports the dict operations MainMenu uses: `in`, `[]`, len() and
+    iterating over names.
+    """
+    
+    def __init__(self, capacity=8):
+        """
+        Initialize an empty store
+        
+        Args:
+            capacity (int): Number of models to allocate space for up front
+        """
+        self.names = []
+        self.models = []
+        self._index = {}
+        self.vertex_counts = np.zeros(capacity, dtype=np.int32)
+        self.face_counts = np.zeros(capacity, dtype=np.int32)
+        self.bbox_min = np.zeros((capacity, 3), dtype=np.float32)
+        self.bbox_max = np.zeros((capacity, 3), dtype=np.float32)
+    
+    def add(self, name, model):
+        """
+        Add a model, replacing any model already stored under the name
+        
+        Args:
+            name (str): Model filename
+            model (BlenderModel): The loaded model
+        """
+        i = self._index.get(name)
+        if i is None:
+            i = len(self.models)
+            if i == len(self.vertex_counts):
+                # Double the arrays, keeping stored entries
+                for attr in ('vertex_counts', 'face_counts', 'bbox_min', 'bbox_max'):
+                    arr = getattr(self, attr)
+                    grown = np.zeros((len(arr) * 2,) + arr.shape[1:], dtype=arr.dtype)
+                    grown[:i] = arr
+                    setattr(self, attr, grown)
+            self._index[name] = i
+            self.names.append(name)
+            self.models.append(model)
+        else:
+            self.models[i] = model
+        
+        vertices = np.asarray(model.vertices, dtype=np.float32).reshape(-1, 3)
+        self.vertex_counts[i] = len(vertices)
+        self.face_counts[i] = len(model.faces)
+        if len(vertices):
+            self.bbox_min[i] = vertices.min(axis=0)
+            self.bbox_max[i] = vertices.max(axis=0)
+    
+    def __contains__(self, name):
+        return name in self._index
+    
+    def __getitem__(self, name):
+        return self.models[self._index[name]]
+    
+    def __len__(self):
+        return len(self.models)
+    
+    def __iter__(self):
+        return iter(self.names)
+
 class AnimationLoader:
     """Class for loading Blender animation frames"""
     
@@ -417,6 +633,9 @@ class AnimationLoader:
                 file_path = os.path.join(frames_dir, filename)
                 try:
                     surface = pygame.image.load(file_path)
+                    # Convert once to the display format so blits don't have to
+                    if pygame.display.get_surface() is not None:
+                        surface = surface.convert_alpha()
                     self.frames.append(surface)
                 except Exception as e:
                     print(f"Error loading frame {file_path}: {e}")
@@ -0,0 +1,131 @@
+"""
+block_kernels.py - Per-frame physics for the falling blocks in the bounce game
+"""
+import numpy as np
+
+# Numba is optional - without it the NumPy implementation is used
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _step_blocks_loop(xs, ys, ws, hs, vys, decay_levels, grid_rows, grid_cols,
+                      n, delta_time, screen_height, px, py, pw, ph):
+    """
+    Move, bounce, cull and collide blocks in a single pass (compiled by Numba)
+
+    Live blocks are compacted to the front of the arrays in place.
+
+    Args:
+        xs, ys, ws, hs (np.ndarray): Block positions and sizes
+        vys (np.ndarray): Block vertical velocities
+        decay_levels (np.ndarray): Block decay levels (0.0 to 1.0)
+        grid_rows, grid_cols (np.ndarray): Block positions in the decay grid
+        n (int): Number of live blocks
+        delta_time (float): Time in seconds since last update
+        screen_height (float): Blocks at or past this y are removed
+        px, py, pw, ph (float): Paddle rectangle
+
+    Returns:
+        tuple: (number of blocks still alive, total decay change from collisions)
+    """
+    total_decay_change = 0.0
+    alive = 0
+    for i in range(n):
+        vy = vys[i]
+        y = ys[i] + vy * delta_time
+
+        # Bounce off top of screen - written as selects rather than a
+        # branch so LLVM can vectorize it
+        top = y < 0.0
+        vy = vy * (-0.9 if top else 1.0)  # Reverse and dampen
+        y = 0.0 if top else y
+
+        # Drop blocks that have fallen off the bottom of the screen
+        if y >= screen_height:
+            continue
+
+        x = xs[i]
+        w = ws[i]
+        h = hs[i]
+        decay = decay_levels[i]
+
+        # Collision with paddle - stronger upward bounce, healthier block
+        if x < px + pw and x + w > px and y < py + ph and y + h > py:
+            vy *= -1.2
+            new_decay = max(0.0, decay - 0.2)
+            total_decay_change += (decay - new_decay) * 2.0
+            decay = new_decay
+
+        xs[alive] = x
+        ys[alive] = y
+        ws[alive] = w
+        hs[alive] = h
+        vys[alive] = vy
+        decay_levels[alive] = decay
+        grid_rows[alive] = grid_rows[i]
+        grid_cols[alive] = grid_cols[i]
+        alive += 1
+
+    return alive, total_decay_change
+
+
+def _step_blocks_numpy(xs, ys, ws, hs, vys, decay_levels, grid_rows, grid_cols,
+                       n, delta_time, screen_height, px, py, pw, ph):
+    """Vectorized NumPy equivalent of _step_blocks_loop"""
+    if n == 0:
+        return 0, 0.0
+
+    # Move blocks, bouncing off top of screen (reverse and dampen)
+    ys[:n] += vys[:n] * delta_time
+    vys[:n] *= np.where(ys[:n] < 0.0, -0.9, 1.0)
+    np.maximum(ys[:n], 0.0, out=ys[:n])
+
+    # Compact the arrays, keeping only blocks still on screen
+    alive = ys[:n] < screen_height
+    if not alive.all():
+        count = int(np.count_nonzero(alive))
+        for arr in (xs, ys, ws, hs, vys, decay_levels, grid_rows, grid_cols):
+            arr[:count] = arr[:n][alive]
+        n = count
+
+    xs = xs[:n]
+    ys = ys[:n]
+    vys = vys[:n]
+    decay_levels = decay_levels[:n]
+
+    # Check remaining blocks for collision with paddle
+    hit = (xs < px + pw) & (xs + ws[:n] > px) & (ys < py + ph) & (ys + hs[:n] > py)
+    if not hit.any():
+        return n, 0.0
+
+    # Stronger upward bounce, with no horizontal movement
+    vys[hit] *= -1.2
+
+    # Reduce decay level with each hit (block becomes "healthier")
+    old_decay = decay_levels[hit]
+    new_decay = np.maximum(0.0, old_decay - 0.2)
+    decay_levels[hit] = new_decay
+
+    return n, float((old_decay - new_decay).sum()) * 2.0
+
+
+if njit is not None:
+    step_blocks = njit(cache=True)(_step_blocks_loop)
+else:
+    step_blocks = _step_blocks_numpy
+
+
+def warm_up(screen_height):
+    """
+    Compile step_blocks ahead of gameplay so the first frame doesn't stall
+
+    Args:
+        screen_height (int): Height of the screen
+    """
+    floats = np.zeros(1, dtype=np.float64)
+    ints = np.zeros(1, dtype=np.int32)
+    step_blocks(floats, floats.copy(), floats.copy(), floats.copy(), floats.copy(),
+                floats.copy(), ints, ints.copy(), 0, 0.0, float(screen_height),
+                0.0, 0.0, 0.0, 0.0)
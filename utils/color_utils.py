@@ -5,6 +5,7 @@ import sys
 import os
 import math
 import random
+import numpy as np
 from .asset_utils import get_asset_path
 
 def interpolate_color(color1, color2, factor):
@@ -111,6 +112,35 @@ def apply_decay_to_color(color, decay_factor, noise=True):
     
     return (r, g, b)
 
+def apply_decay_to_colors(colors, decay_factor, noise=True):
+    """
+    Apply decay effect to many colors at once (vectorized apply_decay_to_color)
+    
+    Args:
+        colors (np.ndarray): Array of shape (n, 3) with RGB colors
+        decay_factor (float): Decay factor (0.0 to 1.0, where 1.0 is fully decayed)
+        noise (bool): Whether to add noise effect
+    
+    Returns:
+        np.ndarray: Array of shape (n, 3) with decayed uint8 RGB colors
+    """
+    # Ensure valid input
+    decay_factor = max(0.0, min(1.0, decay_factor))
+    
+    # Decay the colors by reducing brightness and adding a red tint
+    scale = np.array([1 - decay_factor * 0.5, 1 - decay_factor * 0.7, 1 - decay_factor * 0.7])
+    offset = np.array([decay_factor * 50, 0.0, 0.0])
+    decayed = np.floor(np.asarray(colors, dtype=np.float64) * scale + offset)
+    
+    # Add noise for a "damaged" effect
+    if noise and decay_factor > 0.3:
+        noise_amount = int(decay_factor * 30)
+        decayed += np.random.randint(-noise_amount, noise_amount + 1, size=decayed.shape)
+    
+    # Clamp once for every channel of every color
+    np.clip(decayed, 0, 255, out=decayed)
+    return decayed.astype(np.uint8)
+
 def hsv_to_rgb(h, s, v):
     """
     Convert HSV color to RGB
@@ -0,0 +1,58 @@
+"""
+menu_kernels.py - Per-frame maths for the flying objects in the main menu
+"""
+import numpy as np
+
+# Numba is optional - without it the NumPy implementation is used
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _project_to_screen_loop(positions, n, center_x, center_y, scale, screen, visible):
+    """
+    Project object positions to screen coordinates for their labels (compiled by Numba)
+    
+    Args:
+        positions (np.ndarray): (N, 3) object positions
+        n (int): Number of live objects
+        center_x, center_y (int): Screen center
+        scale (float): Screen pixels per world unit at the origin
+        screen (np.ndarray): (N, 2) int32 output screen coordinates
+        visible (np.ndarray): (N,) bool output - False for objects out of view,
+                              whose screen coordinates are left unset
+    """
+    for i in range(n):
+        x = positions[i, 0]
+        y = positions[i, 1]
+        z = positions[i, 2]
+        visible[i] = z > -15.0 and abs(x) < 10.0 and abs(y) < 10.0
+        if visible[i]:
+            # Perspective factor (objects further away appear smaller)
+            perspective_factor = 15.0 / max(0.1, 15.0 + z)
+            screen[i, 0] = center_x + int(x * scale * perspective_factor)
+            screen[i, 1] = center_y - int(y * scale * perspective_factor)
+
+
+def _project_to_screen_numpy(positions, n, center_x, center_y, scale, screen, visible):
+    """Vectorized NumPy equivalent of _project_to_screen_loop"""
+    x, y, z = positions[:n].astype(np.float64).T
+    visible[:n] = (z > -15.0) & (np.abs(x) < 10.0) & (np.abs(y) < 10.0)
+    
+    # Perspective factor (objects further away appear smaller) - astype truncates like int()
+    perspective_factor = 15.0 / np.maximum(0.1, 15.0 + z)
+    screen[:n, 0] = center_x + (x * scale * perspective_factor).astype(np.int32)
+    screen[:n, 1] = center_y - (y * scale * perspective_factor).astype(np.int32)
+
+
+if njit is not None:
+    project_to_screen = njit(cache=True)(_project_to_screen_loop)
+else:
+    project_to_screen = _project_to_screen_numpy
+
+
+def warm_up():
+    """Compile project_to_screen ahead of the menu's first frame"""
+    project_to_screen(np.zeros((1, 3), dtype=np.float32), 0, 0, 0, 1.0,
+                      np.zeros((1, 2), dtype=np.int32), np.zeros(1, dtype=np.bool_))